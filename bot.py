@@ -43,6 +43,13 @@ class GrooveMaster(commands.Bot):
         # Performance tracking
         self.command_count = 0
         self.error_count = 0
+        
+        # Cached totals so stats and the web interface never have to
+        # scan all guilds. The user total is a snapshot: resynced on
+        # on_ready and adjusted on guild join/leave only — per-member
+        # events would need the privileged members intent
+        self._cached_user_total = 0
+        self._voice_connection_count = 0
 
     async def _get_prefix(self, bot, message):
         """Dynamic prefix support."""
@@ -77,12 +84,15 @@ class GrooveMaster(commands.Bot):
 
     async def on_ready(self):
         """Called when bot is ready."""
+        self._cached_user_total = sum(guild.member_count or 0 for guild in self.guilds)
+        self._voice_connection_count = sum(1 for guild in self.guilds if guild.voice_client)
+        
         self.logger.info(
             "Bot is ready",
             bot_name=self.user.name,
             bot_id=self.user.id,
             guild_count=len(self.guilds),
-            user_count=sum(guild.member_count for guild in self.guilds)
+            user_count=self._cached_user_total
         )
         
         # Set presence
@@ -93,12 +103,11 @@ class GrooveMaster(commands.Bot):
         await self.change_presence(activity=activity)
         
         # Update monitoring
-        performance_monitor.update_voice_connections(
-            sum(1 for guild in self.guilds if guild.voice_client)
-        )
+        performance_monitor.update_voice_connections(self._voice_connection_count)
 
     async def on_guild_join(self, guild):
         """Called when bot joins a guild."""
+        self._cached_user_total += guild.member_count or 0
         self.logger.info("Joined guild", guild_name=guild.name, guild_id=guild.id, member_count=guild.member_count)
         
         # Update presence
@@ -110,6 +119,7 @@ class GrooveMaster(commands.Bot):
 
     async def on_guild_remove(self, guild):
         """Called when bot leaves a guild."""
+        self._cached_user_total -= guild.member_count or 0
         self.logger.info("Left guild", guild_name=guild.name, guild_id=guild.id)
         
         # Update presence
@@ -122,6 +132,11 @@ class GrooveMaster(commands.Bot):
     async def on_voice_state_update(self, member, before, after):
         """Handle voice state updates for auto-disconnect."""
         if member == self.user:
+            # Track the bot's own channel joins/leaves for the stats counter
+            if before.channel is None and after.channel is not None:
+                self._voice_connection_count += 1
+            elif before.channel is not None and after.channel is None:
+                self._voice_connection_count = max(0, self._voice_connection_count - 1)
             return
         
         # Check if bot is alone in voice channel
@@ -318,10 +333,10 @@ class GrooveMaster(commands.Bot):
         return {
             'uptime': self.get_uptime(),
             'guild_count': len(self.guilds),
-            'user_count': sum(guild.member_count for guild in self.guilds),
+            'user_count': self._cached_user_total,
             'command_count': self.command_count,
             'error_count': self.error_count,
-            'voice_connections': sum(1 for guild in self.guilds if guild.voice_client)
+            'voice_connections': self._voice_connection_count
         }
 
 # Create and run bot
@@ -344,7 +359,15 @@ async def main():
 if __name__ == "__main__":
     # Setup basic logging for startup
     setup_logger()
-    
+
+    # uvloop speeds up task switching and executor dispatch noticeably;
+    # optional because it doesn't support Windows
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -303,6 +303,14 @@ class Admin(commands.Cog, LoggerMixin):
         await ctx.send(embed=embed, ephemeral=True)
         self.log_command(ctx, 'config')
 
+    @staticmethod
+    def _invalidate_web_cog_cache():
+        """Let the web integration re-resolve its cog after a reload."""
+        from web_integration import get_web_integration
+        integration = get_web_integration()
+        if integration:
+            integration.invalidate_cog_cache()
+
     @commands.hybrid_command(name="reload")
     @commands.has_permissions(administrator=True)
     async def reload_cog(self, ctx: commands.Context, cog_name: str = None):
@@ -310,6 +318,7 @@ class Admin(commands.Cog, LoggerMixin):
         if cog_name:
             try:
                 await self.bot.reload_extension(f'cogs.{cog_name}')
+                self._invalidate_web_cog_cache()
                 embed = discord.Embed(
                     title="✅ Cog neu geladen",
                     description=f"Cog `{cog_name}` wurde erfolgreich neu geladen.",
@@ -337,7 +346,9 @@ class Admin(commands.Cog, LoggerMixin):
                     reloaded.append(cog)
                 except Exception as e:
                     failed.append(f"{cog}: {str(e)}")
-            
+
+            self._invalidate_web_cog_cache()
+
             embed = discord.Embed(
                 title="🔄 Cogs neu geladen",
                 color=discord.Color.green() if not failed else discord.Color.orange()
@@ -14,6 +14,7 @@ from utils.exceptions import *
 from utils.queue_manager import QueueManager
 from utils.monitoring import performance_monitor
 from utils.cache import cache_manager
+from web_integration import get_web_integration
 import time
 
 class Music(commands.Cog, LoggerMixin):
@@ -25,6 +26,10 @@ class Music(commands.Cog, LoggerMixin):
         self.current_song: Optional[Song] = None
         self.is_playing = False
         self.volume = settings.default_volume
+        # Serializes volume writes from concurrent modal submits
+        self._volume_lock = asyncio.Lock()
+        # Serializes the playback-start check across download workers
+        self._playback_start_lock = asyncio.Lock()
         self.repeat_mode = False
         self.now_playing_message: Optional[discord.Message] = None
         self.update_task: Optional[asyncio.Task] = None
@@ -33,7 +38,7 @@ class Music(commands.Cog, LoggerMixin):
         self.pause_start: Optional[float] = None
         self.intro_dir = settings.intros_dir
         self.download_queue = asyncio.Queue()
-        self.download_task = None
+        self.download_tasks: List[asyncio.Task] = []
         self.auto_disconnect_task: Optional[asyncio.Task] = None
         self.last_activity = time.time()
         
@@ -43,6 +48,10 @@ class Music(commands.Cog, LoggerMixin):
     async def cog_load(self):
         """Called when the cog is loaded."""
         self.logger.info("Music cog loaded")
+        # One persistent control view for every now-playing message; also
+        # revives button callbacks on messages from before a restart
+        self.control_view = MusicControlView(self)
+        self.bot.add_view(self.control_view)
         await self.queue_manager.load_queue_state(self.bot)
         
         if settings.enable_slash_commands:
@@ -117,9 +126,7 @@ class Music(commands.Cog, LoggerMixin):
             return
 
         await self.download_queue.put((song, ctx))
-        
-        if self.download_task is None or self.download_task.done():
-            self.download_task = asyncio.create_task(self._process_download_queue())
+        self._ensure_download_workers()
 
         message = f"🎵 **{song.title}** wurde zur Warteschlange hinzugefügt."
         if ctx.interaction:
@@ -144,14 +151,13 @@ class Music(commands.Cog, LoggerMixin):
             return
         
         added_count = await self.queue_manager.add_songs(songs)
+        await self._notify_web(queue=True)
         
         # Start downloads
         for song in songs[:added_count]:
             await self.download_queue.put((song, ctx))
-        
-        if self.download_task is None or self.download_task.done():
-            self.download_task = asyncio.create_task(self._process_download_queue())
-        
+        self._ensure_download_workers()
+
         message = f"📋 **{added_count}** Songs aus der Playlist hinzugefügt."
         if ctx.interaction:
             await ctx.edit_original_response(content=message)
@@ -207,6 +213,7 @@ class Music(commands.Cog, LoggerMixin):
             await ctx.send("❌ Es wird gerade keine Musik abgespielt.", ephemeral=True)
         
         self._update_activity()
+        await self._notify_web()
         self.log_command(ctx, 'pause')
 
     @commands.hybrid_command(name="volume", aliases=['vol'])
@@ -227,6 +234,7 @@ class Music(commands.Cog, LoggerMixin):
             ctx.voice_client.source.volume = self.volume
         
         await ctx.send(f"🔊 Lautstärke auf **{volume}%** gesetzt.", ephemeral=True)
+        await self._notify_web()
         self.log_command(ctx, 'volume', volume=volume)
 
     @commands.hybrid_command(name="queue", aliases=['q'])
@@ -250,7 +258,7 @@ class Music(commands.Cog, LoggerMixin):
             return
         
         embed = await create_now_playing_embed(self)
-        view = MusicControlView(self)
+        view = self.control_view
         
         if ctx.interaction:
             await ctx.response.send_message(embed=embed, view=view, ephemeral=True)
@@ -268,6 +276,7 @@ class Music(commands.Cog, LoggerMixin):
         
         await self.queue_manager.shuffle()
         await ctx.send("🔀 Warteschlange wurde gemischt.", ephemeral=True)
+        await self._notify_web(queue=True)
         self.log_command(ctx, 'shuffle')
 
     @commands.hybrid_command(name="repeat")
@@ -277,6 +286,7 @@ class Music(commands.Cog, LoggerMixin):
         status = "aktiviert" if self.repeat_mode else "deaktiviert"
         emoji = "🔁" if self.repeat_mode else "🔁"
         await ctx.send(f"{emoji} Wiederholung **{status}**.", ephemeral=True)
+        await self._notify_web()
         self.log_command(ctx, 'repeat', enabled=self.repeat_mode)
 
     @commands.hybrid_command(name="remove")
@@ -290,6 +300,7 @@ class Music(commands.Cog, LoggerMixin):
         removed_song = await self.queue_manager.remove_song(index - 1)
         if removed_song:
             await ctx.send(f"🗑️ **{removed_song.title}** wurde aus der Warteschlange entfernt.", ephemeral=True)
+            await self._notify_web(queue=True)
         else:
             await ctx.send("❌ Fehler beim Entfernen des Songs.", ephemeral=True)
         
@@ -304,6 +315,7 @@ class Music(commands.Cog, LoggerMixin):
         
         await self.queue_manager.clear()
         await ctx.send("🗑️ Warteschlange wurde geleert.", ephemeral=True)
+        await self._notify_web(queue=True)
         self.log_command(ctx, 'clear')
 
     # Voice channel management
@@ -387,6 +399,21 @@ class Music(commands.Cog, LoggerMixin):
         """Update last activity timestamp."""
         self.last_activity = time.time()
 
+    async def _notify_web(self, *, song: bool = False, queue: bool = False):
+        """Forward state changes to the web interface, if one is attached.
+
+        Without arguments only the dirty flag is set (pause, volume,
+        repeat); song/queue additionally feed the debounced notifiers.
+        """
+        integration = get_web_integration()
+        if not integration:
+            return
+        if song:
+            await integration.notify_song_change(self.current_song)
+        if queue:
+            await integration.notify_queue_change()
+        integration.mark_dirty()
+
     # Playback management
     async def _play_next(self, ctx):
         """Play the next song in the queue."""
@@ -418,6 +445,7 @@ class Music(commands.Cog, LoggerMixin):
                 
                 # Update monitoring
                 performance_monitor.update_queue_size(str(ctx.guild.id), self.queue_manager.size())
+                await self._notify_web(song=True, queue=True)
                 
             except Exception as e:
                 self.logger.error("Failed to play song", error=str(e))
@@ -476,7 +504,7 @@ class Music(commands.Cog, LoggerMixin):
             if self.now_playing_message:
                 try:
                     embed = await create_now_playing_embed(self)
-                    await self.now_playing_message.edit(embed=embed, view=MusicControlView(self))
+                    await self.now_playing_message.edit(embed=embed, view=self.control_view)
                 except discord.NotFound:
                     self.now_playing_message = None
                     break
@@ -498,9 +526,22 @@ class Music(commands.Cog, LoggerMixin):
             return
 
         embed = await create_now_playing_embed(self)
-        self.now_playing_message = await channel.send(embed=embed, view=MusicControlView(self))
+        self.now_playing_message = await channel.send(embed=embed, view=self.control_view)
 
     # Download management
+    def _ensure_download_workers(self):
+        """Keep up to max_concurrent_downloads workers draining the queue.
+
+        Multiple workers let the network fetch of one song overlap the
+        ffmpeg audio extraction of another, instead of serializing both
+        stages behind a single consumer.
+        """
+        self.download_tasks = [t for t in self.download_tasks if not t.done()]
+        while len(self.download_tasks) < settings.max_concurrent_downloads:
+            self.download_tasks.append(
+                asyncio.create_task(self._process_download_queue())
+            )
+
     async def _process_download_queue(self):
         """Process the download queue."""
         while True:
@@ -510,10 +551,20 @@ class Music(commands.Cog, LoggerMixin):
                 try:
                     downloaded_song = await download_audio(song)
                     if downloaded_song:
+                        # With several workers, songs enter the queue in
+                        # download-completion order, not request order
                         await self.queue_manager.add_song(downloaded_song)
-                        if not self.is_playing:
-                            await self._play_next(ctx)
-                        else:
+                        await self._notify_web(queue=True)
+                        # Two workers finishing together could both see
+                        # is_playing False (it is only set inside
+                        # _play_song, several awaits later) and race
+                        # voice_client.play(); the lock keeps exactly one
+                        # starter, the loser just refreshes the message
+                        async with self._playback_start_lock:
+                            should_start = not self.is_playing
+                            if should_start:
+                                await self._play_next(ctx)
+                        if not should_start:
                             await self._update_now_playing(ctx)
                 except Exception as e:
                     self.logger.error("Download failed", title=song.title[:50], error=str(e))
@@ -592,12 +643,13 @@ class Music(commands.Cog, LoggerMixin):
         # Update monitoring
         performance_monitor.update_voice_connections(0)
         performance_monitor.update_queue_size(str(ctx.guild.id), 0)
+        await self._notify_web(song=True, queue=True)
 
     async def cleanup_all(self):
         """Cleanup all resources."""
         await self._stop_update_task()
-        if self.download_task:
-            self.download_task.cancel()
+        for task in self.download_tasks:
+            task.cancel()
         if self.auto_disconnect_task:
             self.auto_disconnect_task.cancel()
         await self.queue_manager.cleanup_all()
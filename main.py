@@ -26,5 +26,12 @@ async def main():
         print("Bot wurde erfolgreich beendet.")
 
 if __name__ == "__main__":
+    # Optionaler uvloop-Event-Loop (nicht unter Windows verfügbar)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
 
@@ -3,7 +3,8 @@
 import asyncio
 import psutil
 import time
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
 from prometheus_client import Counter, Histogram, Gauge, start_http_server
 from config.settings import settings
 from utils.logger import get_logger
@@ -28,6 +29,10 @@ class PerformanceMonitor:
         self.command_stats: Dict[str, Dict[str, Any]] = {}
         self.system_stats: Dict[str, Any] = {}
         self._monitoring_task: Optional[asyncio.Task] = None
+        # Pending Prometheus updates, flushed in batches to avoid taking the
+        # client's internal lock on every recorded command
+        self._pending_counters: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._pending_durations: Dict[str, List[float]] = defaultdict(list)
         
         if settings.enable_metrics:
             self._start_metrics_server()
@@ -54,10 +59,29 @@ class PerformanceMonitor:
                 await self._monitoring_task
             except asyncio.CancelledError:
                 pass
+            self._flush_metrics()
             logger.info("Performance monitoring stopped")
+
+    def _flush_metrics(self):
+        """Flush batched command metrics to Prometheus."""
+        if not settings.enable_metrics:
+            return
+
+        pending_counters, self._pending_counters = self._pending_counters, defaultdict(int)
+        pending_durations, self._pending_durations = self._pending_durations, defaultdict(list)
+
+        for (command_name, status), count in pending_counters.items():
+            commands_total.labels(command=command_name, status=status).inc(count)
+
+        for command_name, durations in pending_durations.items():
+            histogram = command_duration.labels(command=command_name)
+            for duration in durations:
+                histogram.observe(duration)
     
-    async def _monitor_system(self):
+    async def _monitor_system(self, interval: float = 30.0):
         """Monitor system resources periodically."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + interval
         while True:
             try:
                 # Update system metrics
@@ -76,6 +100,7 @@ class PerformanceMonitor:
                 if settings.enable_metrics:
                     memory_usage.set(memory_info.rss)
                     cpu_usage.set(cpu_percent)
+                    self._flush_metrics()
                 
                 # Check memory usage
                 memory_mb = memory_info.rss / 1024 / 1024
@@ -86,11 +111,19 @@ class PerformanceMonitor:
                         limit_mb=settings.max_memory_usage_mb
                     )
                 
-                await asyncio.sleep(30)  # Monitor every 30 seconds
-                
+                # Schedule against the monotonic clock so processing time
+                # doesn't stretch the sampling period
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+                next_tick += interval
+                if next_tick < loop.time():
+                    # More than one period behind; skip ahead instead of
+                    # firing a burst of catch-up ticks
+                    next_tick = loop.time() + interval
+
             except Exception as e:
                 logger.error("Error in system monitoring", error=str(e))
                 await asyncio.sleep(60)
+                next_tick = loop.time() + interval
     
     def record_command(self, command_name: str, duration: float, success: bool = True):
         """Record command execution metrics."""
@@ -114,10 +147,10 @@ class PerformanceMonitor:
         else:
             stats['error_count'] += 1
         
-        # Update Prometheus metrics
+        # Queue Prometheus updates for the next batch flush
         if settings.enable_metrics:
-            commands_total.labels(command=command_name, status=status).inc()
-            command_duration.labels(command=command_name).observe(duration)
+            self._pending_counters[(command_name, status)] += 1
+            self._pending_durations[command_name].append(duration)
         
         logger.debug(
             "Command recorded",
@@ -1,13 +1,18 @@
 import discord
-import yt_dlp
 import asyncio
+import functools
+import hashlib
 import os
 import re
+import shutil
+import threading
 import time
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from tenacity import retry, stop_after_attempt, wait_exponential
 from config.settings import settings
@@ -24,7 +29,41 @@ download_executor = ThreadPoolExecutor(
     thread_name_prefix="yt-dlp"
 )
 
-@dataclass
+# Bounds concurrent yt-dlp calls before they reach the executor, so a big
+# playlist can't pile up hundreds of pending futures (memory + rate limits)
+_ytdl_semaphore = asyncio.Semaphore(settings.max_concurrent_downloads)
+
+# Characters stripped from titles before display/filesystem use; compiled
+# once since every Song constructed runs this
+_TITLE_BAD_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# In-process Song templates keyed like the metadata cache. A hit costs a
+# single dataclasses.replace instead of rebuilding the Song from a dict
+# (which re-runs title cleanup and Path validation). The file cache still
+# backs restarts; this layer only lives as long as the process.
+_song_templates: Dict[str, 'Song'] = {}
+_SONG_TEMPLATE_LIMIT = 1024
+
+def _store_song_template(cache_key: str, song: 'Song'):
+    if len(_song_templates) >= _SONG_TEMPLATE_LIMIT:
+        _song_templates.clear()
+    _song_templates[cache_key] = song
+
+# Searches currently being extracted, keyed like the cache; used to
+# coalesce concurrent identical requests onto one network call
+_inflight: Dict[str, asyncio.Future] = {}
+
+def _cache_digest(value: str) -> str:
+    """Stable digest for cache keys.
+
+    Built-in hash() is randomized per process, which silently invalidated
+    the persisted search/playlist cache on every restart.
+    """
+    return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+# slots=True drops the per-instance __dict__ — queues can hold thousands
+# of Songs, and all attribute writes target declared fields
+@dataclass(slots=True)
 class Song:
     """Enhanced Song class with comprehensive metadata and validation."""
     url: str
@@ -34,7 +73,10 @@ class Song:
     thumbnail: str = ""
     file_path: Optional[Path] = None
     start_time: Optional[float] = None
-    added_at: datetime = field(default_factory=datetime.now)
+    added_at: float = field(default_factory=time.time)
+    # Monotonic twin of added_at for age computations — immune to wall
+    # clock jumps and cheaper to diff than datetime arithmetic
+    added_monotonic: float = field(default_factory=time.monotonic, repr=False, compare=False)
     download_progress: float = 0.0
     uploader: str = ""
     view_count: int = 0
@@ -42,7 +84,15 @@ class Song:
     upload_date: Optional[str] = None
     description: str = ""
     tags: List[str] = field(default_factory=list)
-    
+    _formatted_duration: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _short_titles: Dict[int, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _queue_line: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _stat_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _queue_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _player_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    file_size_bytes: int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate and clean data after initialization."""
         self.title = self._clean_title(self.title)
@@ -52,69 +102,184 @@ class Song:
     def _clean_title(self, title: str) -> str:
         """Clean and truncate title."""
         # Remove problematic characters
-        cleaned = re.sub(r'[<>:"/\\|?*]', '', title)
+        cleaned = _TITLE_BAD_CHARS.sub('', title)
         return cleaned[:100] if len(cleaned) > 100 else cleaned
+
+    @classmethod
+    def from_ytdl_entry(cls, entry: Dict[str, Any], requester) -> 'Song':
+        """Build a Song from a yt-dlp info dict.
+
+        Centralizes the per-field defaulting that was previously inlined at
+        every constructor call site — playlist ingestion runs this in a loop.
+        """
+        thumbnail = entry.get('thumbnail')
+        return cls(
+            url=entry.get('webpage_url') or entry.get('url') or '',
+            title=entry.get('title') or 'Unknown Title',
+            duration=entry.get('duration') or 0,
+            requester=requester,
+            thumbnail=thumbnail if isinstance(thumbnail, str) else '',
+            uploader=entry.get('uploader') or '',
+            view_count=entry.get('view_count') or 0,
+            like_count=entry.get('like_count') or 0,
+            upload_date=entry.get('upload_date'),
+            description=(entry.get('description') or '')[:500],
+            tags=(entry.get('tags') or [])[:10],
+        )
     
     @property
     def formatted_duration(self) -> str:
-        """Get formatted duration string."""
-        return format_duration(self.duration)
+        """Get formatted duration string (cached — duration never changes)."""
+        if self._formatted_duration is None:
+            self._formatted_duration = format_duration(self.duration)
+        return self._formatted_duration
     
+    @property
+    def display_title(self) -> str:
+        """Title truncated for embed display (cached — title never changes)."""
+        return self.short_title(40)
+
+    @property
+    def queue_line(self) -> str:
+        """Static part of this song's queue-embed row (cached).
+
+        Position and download status vary per render and are prepended or
+        appended by the caller; title and duration never change.
+        """
+        if self._queue_line is None:
+            self._queue_line = f"**{self.short_title(35)}** `[{self.formatted_duration}]`"
+        return self._queue_line
+
+    def short_title(self, limit: int) -> str:
+        """Title truncated to limit characters, cached per limit.
+
+        The queue embed, the now-playing field and the per-user listing
+        each use a different cutoff; re-renders reuse the stored string
+        instead of re-slicing and re-concatenating.
+        """
+        cached = self._short_titles.get(limit)
+        if cached is None:
+            title = self.title
+            cached = title if len(title) <= limit else title[:limit] + "..."
+            self._short_titles[limit] = cached
+        return cached
+
+    def _stat(self) -> Optional[os.stat_result]:
+        """stat() the downloaded file, cached for ~2s.
+
+        is_downloaded and file_size_mb are read on every queue render and
+        embed refresh; without the cache each read is a syscall per song.
+        """
+        if not self.file_path:
+            return None
+        now = time.monotonic()
+        if self._stat_cache is not None and now - self._stat_cache[0] < 2.0:
+            return self._stat_cache[1]
+        try:
+            result = os.stat(self.file_path)
+        except OSError:
+            result = None
+        self._stat_cache = (now, result)
+        return result
+
     @property
     def is_downloaded(self) -> bool:
         """Check if song is downloaded and file exists."""
-        return self.file_path and self.file_path.exists()
-    
+        return self._stat() is not None
+
     @property
     def file_size_mb(self) -> float:
         """Get file size in MB."""
-        if self.is_downloaded:
-            return self.file_path.stat().st_size / 1024 / 1024
-        return 0.0
+        # download_audio records the size once; the file never changes
+        # afterwards, so skip the stat entirely when it's known
+        if self.file_size_bytes:
+            return self.file_size_bytes / 1048576
+        stat_result = self._stat()
+        return stat_result.st_size / 1048576 if stat_result else 0.0
     
     @property
     def age_minutes(self) -> float:
         """Get age of song in minutes since added."""
-        return (datetime.now() - self.added_at).total_seconds() / 60
+        return (time.monotonic() - self.added_monotonic) / 60
     
     def cleanup(self):
         """Clean up downloaded file with error handling."""
-        if self.file_path and self.file_path.exists():
-            try:
-                self.file_path.unlink()
-                logger.debug("File cleaned up", file=str(self.file_path))
-            except Exception as e:
-                logger.error("Failed to cleanup file", file=str(self.file_path), error=str(e))
+        if not self.file_path:
+            return
+        self._stat_cache = None
+        self.file_size_bytes = 0
+        try:
+            os.unlink(self.file_path)
+            logger.debug("File cleaned up", file=str(self.file_path))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error("Failed to cleanup file", file=str(self.file_path), error=str(e))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            'url': self.url,
-            'title': self.title,
-            'duration': self.duration,
-            'requester_id': self.requester.id,
-            'thumbnail': self.thumbnail,
-            'uploader': self.uploader,
-            'view_count': self.view_count,
-            'added_at': self.added_at.isoformat()
-        }
+        # Every serialized field is fixed after creation, so the dict can
+        # be built once and reused by each queue persist
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'url': self.url,
+                'title': self.title,
+                'duration': self.duration,
+                'requester_id': self.requester.id,
+                'thumbnail': self.thumbnail,
+                'uploader': self.uploader,
+                'view_count': self.view_count,
+                'added_at': datetime.fromtimestamp(self.added_at).isoformat()
+            }
+        return self._dict_cache
+
+    def to_queue_dict(self) -> Dict[str, Any]:
+        """Slim payload for web queue listings, built once per song.
+
+        The queue panel renders these fields including the thumbnail;
+        url rides along solely with the player payload.
+        """
+        if self._queue_dict is None:
+            self._queue_dict = {
+                'title': self.title,
+                'artist': self.uploader,
+                'duration': self.duration,
+                'thumbnail': self.thumbnail,
+                'requester': self.requester.display_name
+            }
+        return self._queue_dict
+
+    def to_player_dict(self) -> Dict[str, Any]:
+        """Full payload for the web player; callers add currentTime."""
+        if self._player_dict is None:
+            self._player_dict = {
+                'title': self.title,
+                'artist': self.uploader,
+                'duration': self.duration,
+                'thumbnail': self.thumbnail,
+                'url': self.url
+            }
+        return self._player_dict
+
+# Progress bar characters, hoisted so the hot render path skips the
+# settings attribute lookups
+_BAR_LENGTH = settings.progress_bar_length
+_BAR_FILLED = settings.progress_bar_filled
+_BAR_EMPTY = settings.progress_bar_empty
 
 def create_progress_bar(current_time: float, total_time: float) -> str:
     """Create an enhanced visual progress bar."""
     if total_time <= 0:
-        return f"[{settings.progress_bar_empty * settings.progress_bar_length}] 0%"
-    
+        return f"[{_BAR_EMPTY * _BAR_LENGTH}] 0%"
+
     progress = min(current_time / total_time, 1.0)
-    filled_length = int(settings.progress_bar_length * progress)
-    
-    bar = ''.join([
-        settings.progress_bar_filled if i < filled_length 
-        else settings.progress_bar_empty 
-        for i in range(settings.progress_bar_length)
-    ])
-    
-    percentage = int(progress * 100)
-    return f"[{bar}] {percentage}%"
+    filled_length = int(_BAR_LENGTH * progress)
+
+    # Both segments are contiguous, so string repetition beats building
+    # the bar character by character
+    bar = _BAR_FILLED * filled_length + _BAR_EMPTY * (_BAR_LENGTH - filled_length)
+
+    return f"[{bar}] {int(progress * 100)}%"
 
 def format_duration(duration: int) -> str:
     """Enhanced duration formatting with better handling."""
@@ -129,107 +294,176 @@ def format_duration(duration: int) -> str:
     else:
         return f"{minutes}:{seconds:02d}"
 
+_SUFFIXES = (
+    (1_000_000_000, 'B'),
+    (1_000_000, 'M'),
+    (1_000, 'K'),
+)
+
+@functools.lru_cache(maxsize=1024)
 def format_number(number: int) -> str:
     """Format large numbers with K/M/B suffixes."""
-    if number >= 1_000_000_000:
-        return f"{number / 1_000_000_000:.1f}B"
-    elif number >= 1_000_000:
-        return f"{number / 1_000_000:.1f}M"
-    elif number >= 1_000:
-        return f"{number / 1_000:.1f}K"
-    else:
-        return str(number)
+    for threshold, suffix in _SUFFIXES:
+        if number >= threshold:
+            return f"{number / threshold:.1f}{suffix}"
+    return str(number)
+
+# Matches SS, MM:SS and HH:MM:SS in a single pass; the digit-only groups
+# also rule out negative values
+_TIME_INPUT_RE = re.compile(r"^\s*(?:(?:(\d+):)?(\d+):)?(\d+)\s*$")
 
+@functools.lru_cache(maxsize=4096)
 def parse_time_input(time_input: str) -> int:
     """Enhanced time parsing with better validation."""
-    time_input = time_input.strip()
-    
-    # Handle MM:SS or HH:MM:SS format
-    if ':' in time_input:
-        parts = time_input.split(':')
-        try:
-            if len(parts) == 2:  # MM:SS
-                minutes, seconds = map(int, parts)
-                if minutes < 0 or seconds < 0 or seconds >= 60:
-                    raise InvalidTimeFormatError(f"Invalid time values: {time_input}")
-                return minutes * 60 + seconds
-            elif len(parts) == 3:  # HH:MM:SS
-                hours, minutes, seconds = map(int, parts)
-                if any(x < 0 for x in [hours, minutes, seconds]) or minutes >= 60 or seconds >= 60:
-                    raise InvalidTimeFormatError(f"Invalid time values: {time_input}")
-                return hours * 3600 + minutes * 60 + seconds
-            else:
-                raise InvalidTimeFormatError(f"Invalid time format: {time_input}")
-        except ValueError:
-            raise InvalidTimeFormatError(f"Invalid time format: {time_input}")
-    
-    # Handle seconds only
-    try:
-        seconds = int(time_input)
-        if seconds < 0:
-            raise InvalidTimeFormatError("Time cannot be negative")
-        return seconds
-    except ValueError:
+    match = _TIME_INPUT_RE.match(time_input)
+    if not match:
         raise InvalidTimeFormatError(f"Invalid time format: {time_input}")
 
+    hours_str, minutes_str, seconds_str = match.groups()
+    hours = int(hours_str) if hours_str else 0
+    minutes = int(minutes_str) if minutes_str else 0
+    seconds = int(seconds_str)
+
+    # Lower units must stay below 60 once a higher unit is given
+    if minutes_str is not None and seconds >= 60:
+        raise InvalidTimeFormatError(f"Invalid time values: {time_input}")
+    if hours_str is not None and minutes >= 60:
+        raise InvalidTimeFormatError(f"Invalid time values: {time_input}")
+
+    return hours * 3600 + minutes * 60 + seconds
+
+# Precompiled URL patterns — clean_youtube_url runs on every /play.
+# The video pattern covers watch?v=, youtu.be/ and embed/ forms; no
+# trailing .* so the engine stops right after the 11-char ID.
+_YT_PLAYLIST_RE = re.compile(r"[&?]list=([a-zA-Z0-9_-]+)")
+_YT_VIDEO_ID_RE = re.compile(r"(?:v=|/)([0-9A-Za-z_-]{11})")
+
+# Both parsers are pure string functions that see the same inputs over
+# and over (repeated /play of the same link, playlist entries); a bounded
+# cache turns repeats into a dict lookup
+@functools.lru_cache(maxsize=4096)
 def clean_youtube_url(url: str) -> str:
     """Enhanced URL cleaning with playlist support."""
     # Handle playlist URLs
-    playlist_match = re.search(r"[&?]list=([a-zA-Z0-9_-]+)", url)
-    if playlist_match:
+    if _YT_PLAYLIST_RE.search(url):
         return url  # Return full playlist URL
-    
+
     # Handle video URLs
-    video_patterns = [
-        r"(?:v=|\/)([0-9A-Za-z_-]{11}).*",
-        r"youtu\.be\/([0-9A-Za-z_-]{11})",
-        r"embed\/([0-9A-Za-z_-]{11})"
-    ]
-    
-    for pattern in video_patterns:
-        match = re.search(pattern, url)
-        if match:
-            video_id = match.group(1)
-            return f"https://www.youtube.com/watch?v={video_id}"
-    
+    match = _YT_VIDEO_ID_RE.search(url)
+    if match:
+        return f"https://www.youtube.com/watch?v={match.group(1)}"
+
     return url
 
+# yt-dlp option templates, built once at import and frozen — the dicts
+# are identical across calls, so get_ydl_opts only hands out shallow
+# copies, and MappingProxyType guards against accidental mutation of the
+# shared template (yt-dlp mutates the opts it is given)
+_YDL_OPTS_BASE = MappingProxyType({
+    'quiet': True,
+    'no_warnings': True,
+    'extractaudio': True,
+    'audioformat': 'mp3',
+    'audioquality': '192',
+    'socket_timeout': 30,
+    'retries': 3,
+    'fragment_retries': 3,
+    'skip_unavailable_fragments': True,
+    'ignoreerrors': False,
+    'no_color': True,
+    'extract_flat': False,
+})
+
+# Output template is static; resolve the downloads dir to a plain string
+# once instead of going through pathlib on every options build
+_OUTTMPL = os.path.join(str(settings.downloads_dir), '%(title)s-%(id)s.%(ext)s')
+
+_download_opts = {
+    **_YDL_OPTS_BASE,
+    'format': 'bestaudio[ext=m4a]/bestaudio[ext=mp3]/bestaudio',
+    'postprocessors': [{
+        'key': 'FFmpegExtractAudio',
+        'preferredcodec': 'mp3',
+        'preferredquality': '192',
+    }],
+    'outtmpl': _OUTTMPL,
+    'writeinfojson': False,
+    'writethumbnail': False,
+}
+
+# aria2c fetches in parallel segments, which speeds up bandwidth-bound
+# downloads considerably; only enable it when the binary is installed
+if shutil.which('aria2c'):
+    _download_opts['external_downloader'] = 'aria2c'
+    _download_opts['external_downloader_args'] = ['-x', '4', '-s', '4', '-k', '1M']
+
+_YDL_OPTS_DOWNLOAD = MappingProxyType(_download_opts)
+del _download_opts
+
+_YDL_OPTS_SEARCH = MappingProxyType({
+    **_YDL_OPTS_BASE,
+    'format': 'bestaudio/best',
+    'skip_download': True,
+})
+
+_YDL_OPTS_FLAT = MappingProxyType({
+    'format': 'bestaudio/best',
+    'extract_flat': True,
+    'skip_download': True,
+    'quiet': True,
+    'no_warnings': True,
+    'playlistend': settings.max_playlist_size,
+})
+
 def get_ydl_opts(download: bool = False) -> Dict[str, Any]:
     """Enhanced yt-dlp options with better error handling and performance."""
-    base_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extractaudio': True,
-        'audioformat': 'mp3',
-        'audioquality': '192',
-        'socket_timeout': 30,
-        'retries': 3,
-        'fragment_retries': 3,
-        'skip_unavailable_fragments': True,
-        'ignoreerrors': False,
-        'no_color': True,
-        'extract_flat': False,
-    }
-    
-    if download:
-        base_opts.update({
-            'format': 'bestaudio[ext=m4a]/bestaudio[ext=mp3]/bestaudio',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(settings.downloads_dir / '%(title)s-%(id)s.%(ext)s'),
-            'writeinfojson': False,
-            'writethumbnail': False,
-        })
-    else:
-        base_opts.update({
-            'format': 'bestaudio/best',
-            'skip_download': True,
-        })
-    
-    return base_opts
+    return dict(_YDL_OPTS_DOWNLOAD if download else _YDL_OPTS_SEARCH)
+
+# Shared YoutubeDL instance for metadata-only extraction. Constructing
+# one loads the whole extractor registry, which is too expensive to
+# repeat per search. Downloads keep per-call instances because their
+# options (progress hooks) differ between calls. yt_dlp itself is
+# imported lazily — its package import alone takes hundreds of ms and
+# isn't needed until the first /play.
+_search_ydl = None
+_search_ydl_lock = threading.Lock()
+
+def _get_search_ydl() -> 'yt_dlp.YoutubeDL':
+    """Get the lazily-created shared YoutubeDL instance for searches."""
+    global _search_ydl
+    if _search_ydl is None:
+        with _search_ydl_lock:
+            if _search_ydl is None:
+                import yt_dlp
+                _search_ydl = yt_dlp.YoutubeDL(dict(_YDL_OPTS_SEARCH))
+    return _search_ydl
+
+# Executor entry points take their arguments explicitly so the hot paths
+# don't allocate a fresh closure (frame + cell objects) per call
+
+def _search_extract(query: str) -> Dict[str, Any]:
+    """Blocking metadata extraction via the shared search instance."""
+    return _get_search_ydl().extract_info(query, download=False)
+
+def _ydl_extract(opts: Dict[str, Any], url: str) -> Dict[str, Any]:
+    """Blocking extraction with one-off options (flat playlist scans)."""
+    import yt_dlp
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        return ydl.extract_info(url, download=False)
+
+def _ydl_download(opts: Dict[str, Any], url: str) -> Path:
+    """Blocking download; returns the path of the post-processed file."""
+    import yt_dlp
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(url, download=True)
+
+        # yt-dlp records the post-processed path when postprocessors run
+        try:
+            return Path(info['requested_downloads'][0]['filepath'])
+        except (KeyError, IndexError, TypeError):
+            # Fallback: construct path from template
+            filename = ydl.prepare_filename(info)
+            return Path(os.path.splitext(filename)[0] + '.mp3')
 
 @retry(
     stop=stop_after_attempt(3),
@@ -238,111 +472,175 @@ def get_ydl_opts(download: bool = False) -> Dict[str, Any]:
 async def search_youtube(ctx, query: str) -> Optional[Song]:
     """Enhanced YouTube search with caching and better error handling."""
     start_time = time.time()
-    
-    # Check cache first
-    cache_key = f"search:{hash(query)}"
+
+    # Check cache first (keyed on the normalized URL/query so different
+    # spellings of the same video share an entry)
+    cache_key = f"search:{_cache_digest(clean_youtube_url(query))}"
+
+    template = _song_templates.get(cache_key)
+    if template is not None:
+        logger.debug("Search template hit", query=query[:50])
+        requester = ctx.author if hasattr(ctx, 'author') else ctx.user
+        # Per-request state must not be inherited from the template, or
+        # the copy reports the first-ever search as its queue time
+        return replace(
+            template,
+            requester=requester,
+            added_at=time.time(),
+            added_monotonic=time.monotonic(),
+            start_time=None,
+            download_progress=0.0,
+        )
+
     cached_result = await cache_manager.get(cache_key)
     if cached_result:
         logger.debug("Search cache hit", query=query[:50])
         # Recreate Song object with current requester
         requester = ctx.author if hasattr(ctx, 'author') else ctx.user
         cached_result['requester'] = requester
-        return Song(**cached_result)
-    
-    ydl_opts = get_ydl_opts(download=False)
+        song = Song(**cached_result)
+        _store_song_template(cache_key, song)
+        return song
     
-    try:
-        loop = asyncio.get_event_loop()
-        
-        def extract_info():
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.extract_info(query, download=False)
-        
-        # Use asyncio.wait_for for timeout
-        info = await asyncio.wait_for(
-            loop.run_in_executor(download_executor, extract_info),
-            timeout=45.0
+    # Coalesce concurrent identical searches: the first caller becomes the
+    # leader, followers await its future, and one extract serves everyone
+    existing = _inflight.get(cache_key)
+    if existing is not None:
+        logger.debug("Search coalesced onto in-flight request", query=query[:50])
+        song = await existing
+        if song is None:
+            return None
+        requester = ctx.author if hasattr(ctx, 'author') else ctx.user
+        return replace(
+            song,
+            requester=requester,
+            added_at=time.time(),
+            added_monotonic=time.monotonic(),
+            start_time=None,
+            download_progress=0.0,
         )
-        
-        # Handle different response types
-        video = None
-        if 'entries' in info and info['entries']:
-            # Playlist or search results
-            video = info['entries'][0]
-            if not video:
-                logger.warning("No valid entries found", query=query[:50])
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    result_song: Optional[Song] = None
+    try:
+        try:
+            loop = asyncio.get_running_loop()
+
+            # asyncio.timeout avoids the wrapper task wait_for spawns per call
+            async with _ytdl_semaphore, asyncio.timeout(45.0):
+                info = await loop.run_in_executor(download_executor, _search_extract, query)
+        
+            # Handle different response types
+            video = None
+            if 'entries' in info and info['entries']:
+                # Playlist or search results
+                video = info['entries'][0]
+                if not video:
+                    logger.warning("No valid entries found", query=query[:50])
+                    return None
+            elif 'formats' in info or 'url' in info:
+                # Single video; also covers _type == 'url' results, which are
+                # used as-is instead of triggering a second extract round-trip
+                video = info
+        
+            if not video or not video.get('title'):
+                logger.warning("No video information extracted", query=query[:50])
                 return None
-        elif 'formats' in info or 'url' in info:
-            # Single video
-            video = info
         
-        if not video or not video.get('title'):
-            logger.warning("No video information extracted", query=query[:50])
-            return None
+            # Validate duration
+            duration = video.get('duration', 0)
+            if duration and duration > settings.max_song_duration:
+                logger.warning(
+                    "Song too long",
+                    duration=duration,
+                    max_duration=settings.max_song_duration,
+                    title=video.get('title', '')[:50]
+                )
+                return None
         
-        # Validate duration
-        duration = video.get('duration', 0)
-        if duration and duration > settings.max_song_duration:
-            logger.warning(
-                "Song too long",
-                duration=duration,
-                max_duration=settings.max_song_duration,
-                title=video.get('title', '')[:50]
+            # Handle both Context and Interaction objects
+            requester = ctx.author if hasattr(ctx, 'author') else ctx.user
+
+            song = Song.from_ytdl_entry(video, requester)
+            result_song = song
+
+            # Cache the result (without requester for reusability); video
+            # metadata is stable, so keep it for a day. description/tags are
+            # deliberately dropped — nothing reads them after the first play,
+            # and they dominate the JSON payload size
+            cache_data = {
+                'url': song.url,
+                'title': song.title,
+                'duration': song.duration,
+                'thumbnail': song.thumbnail,
+                'uploader': song.uploader,
+                'view_count': song.view_count,
+                'like_count': song.like_count,
+                'upload_date': song.upload_date,
+            }
+            await cache_manager.set(cache_key, cache_data, ttl=86400)
+            _store_song_template(cache_key, song)
+
+            duration = time.time() - start_time
+            performance_monitor.record_command('search_youtube', duration, True)
+        
+            logger.info(
+                "YouTube search successful",
+                title=song.title[:50],
+                duration=song.formatted_duration,
+                search_time=f"{duration:.2f}s"
             )
-            return None
-        
-        # Handle both Context and Interaction objects
-        requester = ctx.author if hasattr(ctx, 'author') else ctx.user
-        
-        # Create song object with enhanced metadata
-        song_data = {
-            'url': video.get('webpage_url', video.get('url', query)),
-            'title': video.get('title', 'Unknown Title'),
-            'duration': duration or 0,
-            'requester': requester,
-            'thumbnail': video.get('thumbnail', ''),
-            'uploader': video.get('uploader', ''),
-            'view_count': video.get('view_count', 0),
-            'like_count': video.get('like_count', 0),
-            'upload_date': video.get('upload_date'),
-            'description': video.get('description', '')[:500],  # Limit description
-            'tags': video.get('tags', [])[:10]  # Limit tags
-        }
         
-        song = Song(**song_data)
+            return song
         
-        # Cache the result (without requester for reusability)
-        cache_data = song_data.copy()
-        del cache_data['requester']
-        await cache_manager.set(cache_key, cache_data, ttl=3600)
-        
-        duration = time.time() - start_time
-        performance_monitor.record_command('search_youtube', duration, True)
-        
-        logger.info(
-            "YouTube search successful",
-            title=song.title[:50],
-            duration=song.formatted_duration,
-            search_time=f"{duration:.2f}s"
-        )
-        
-        return song
-        
-    except asyncio.TimeoutError:
-        logger.error("Search timeout", query=query[:50])
-        performance_monitor.record_command('search_youtube', time.time() - start_time, False)
-        return None
-    except Exception as e:
-        logger.error("Search failed", query=query[:50], error=str(e))
-        performance_monitor.record_command('search_youtube', time.time() - start_time, False)
+        except asyncio.TimeoutError:
+            logger.error("Search timeout", query=query[:50])
+            performance_monitor.record_command('search_youtube', time.time() - start_time, False)
+            return None
+        except Exception as e:
+            logger.error("Search failed", query=query[:50], error=str(e))
+            performance_monitor.record_command('search_youtube', time.time() - start_time, False)
+            return None
+    finally:
+        if not future.done():
+            future.set_result(result_song)
+        del _inflight[cache_key]
+
+async def _resolve_playlist_entry(entry: Dict[str, Any], requester) -> Optional[Song]:
+    """Resolve a flat playlist entry into a Song, fetching full metadata if needed."""
+    url = entry['url']
+
+    # Flat entries usually carry title/duration already; only hit the
+    # network (cache first) when the duration is missing
+    video = entry
+    if not entry.get('duration'):
+        cache_key = f"search:{_cache_digest(clean_youtube_url(url))}"
+        video = await cache_manager.get(cache_key)
+        if video is None:
+            loop = asyncio.get_running_loop()
+
+            try:
+                async with _ytdl_semaphore, asyncio.timeout(45.0):
+                    video = await loop.run_in_executor(download_executor, _search_extract, url)
+            except Exception as e:
+                logger.warning("Playlist entry resolution failed", url=url[:50], error=str(e))
+                return None
+
+        if not video:
+            return None
+
+    if (video.get('duration') or 0) > settings.max_song_duration:
         return None
 
+    return Song.from_ytdl_entry(video, requester)
+
 async def extract_playlist(ctx, playlist_url: str) -> List[Song]:
     """Enhanced playlist extraction with better handling."""
     start_time = time.time()
     
     # Check cache first
-    cache_key = f"playlist:{hash(playlist_url)}"
+    cache_key = f"playlist:{_cache_digest(playlist_url)}"
     cached_result = await cache_manager.get(cache_key)
     if cached_result:
         logger.debug("Playlist cache hit", url=playlist_url[:50])
@@ -353,62 +651,48 @@ async def extract_playlist(ctx, playlist_url: str) -> List[Song]:
             songs.append(Song(**song_data))
         return songs
     
-    ydl_opts = {
-        'format': 'bestaudio/best',
-        'extract_flat': True,
-        'skip_download': True,
-        'quiet': True,
-        'no_warnings': True,
-        'playlistend': settings.max_playlist_size,
-    }
+    ydl_opts = dict(_YDL_OPTS_FLAT)
     
     try:
-        loop = asyncio.get_event_loop()
-        
-        def extract_info():
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.extract_info(playlist_url, download=False)
-        
-        info = await asyncio.wait_for(
-            loop.run_in_executor(download_executor, extract_info),
-            timeout=60.0
-        )
+        loop = asyncio.get_running_loop()
+
+        async with _ytdl_semaphore, asyncio.timeout(60.0):
+            info = await loop.run_in_executor(download_executor, _ydl_extract, ydl_opts, playlist_url)
         
         if 'entries' not in info:
             logger.warning("No playlist entries found", url=playlist_url[:50])
             return []
-        
-        songs = []
+
         requester = ctx.author if hasattr(ctx, 'author') else ctx.user
+
+        # Resolve entries concurrently; the semaphore bounds the actual
+        # yt-dlp work so this overlaps network RTTs instead of serializing.
+        # islice keeps lazy extract_flat results streaming instead of
+        # materializing the full entry list just to cap it
+        tasks = [
+            asyncio.create_task(_resolve_playlist_entry(entry, requester))
+            for entry in islice(info['entries'], settings.max_playlist_size)
+            if entry and entry.get('url')
+        ]
+        resolved = await asyncio.gather(*tasks, return_exceptions=True)
+
+        songs = []
         cache_data = []
-        
-        for entry in info['entries'][:settings.max_playlist_size]:
-            if not entry or not entry.get('url'):
+        for result in resolved:
+            if result is None or isinstance(result, BaseException):
                 continue
-            
-            song_data = {
-                'url': entry['url'],
-                'title': entry.get('title', 'Unknown Title'),
-                'duration': entry.get('duration', 0),
-                'requester': requester,
-                'thumbnail': entry.get('thumbnail', ''),
-                'uploader': entry.get('uploader', ''),
-            }
-            
-            # Skip songs that are too long
-            if song_data['duration'] > settings.max_song_duration:
-                continue
-            
-            song = Song(**song_data)
-            songs.append(song)
-            
-            # Prepare cache data
-            cache_song_data = song_data.copy()
-            del cache_song_data['requester']
-            cache_data.append(cache_song_data)
-        
-        # Cache the playlist
-        await cache_manager.set(cache_key, cache_data, ttl=1800)  # 30 minutes
+            songs.append(result)
+            cache_data.append({
+                'url': result.url,
+                'title': result.title,
+                'duration': result.duration,
+                'thumbnail': result.thumbnail,
+                'uploader': result.uploader,
+            })
+        
+        # Cache the playlist (shorter TTL — playlists change more often
+        # than individual videos)
+        await cache_manager.set(cache_key, cache_data, ttl=3600)
         
         duration = time.time() - start_time
         logger.info(
@@ -424,6 +708,21 @@ async def extract_playlist(ctx, playlist_url: str) -> List[Song]:
         logger.error("Playlist extraction failed", url=playlist_url[:50], error=str(e))
         return []
 
+async def purge_metadata_cache() -> int:
+    """Remove all cached search/playlist metadata, returns count removed."""
+    keys = [
+        key for key in cache_manager.memory_cache
+        if key.startswith(('search:', 'playlist:'))
+    ]
+    for key in keys:
+        await cache_manager.delete(key)
+    _song_templates.clear()
+
+    if keys:
+        logger.info("Metadata cache purged", entries=len(keys))
+
+    return len(keys)
+
 @retry(
     stop=stop_after_attempt(2),
     wait=wait_exponential(multiplier=1, min=2, max=8)
@@ -436,56 +735,62 @@ async def download_audio(song: Song, progress_callback=None) -> Optional[Song]:
     
     start_time = time.time()
     ydl_opts = get_ydl_opts(download=True)
-    
+    loop = asyncio.get_running_loop()
+
     # Add progress hook if callback provided
     if progress_callback:
+        last_update = [0.0]
+
         def progress_hook(d):
-            if d['status'] == 'downloading':
-                if 'total_bytes' in d and 'downloaded_bytes' in d:
-                    progress = d['downloaded_bytes'] / d['total_bytes']
-                    song.download_progress = progress
-                    asyncio.create_task(progress_callback(progress))
-                elif '_percent_str' in d:
-                    # Fallback for percentage string
-                    try:
-                        percent_str = d['_percent_str'].strip().rstrip('%')
-                        progress = float(percent_str) / 100
-                        song.download_progress = progress
-                        asyncio.create_task(progress_callback(progress))
-                    except (ValueError, AttributeError):
-                        pass
-        
+            if d['status'] != 'downloading':
+                return
+
+            # Throttle to ~4 Hz — yt-dlp fires this per chunk, which can
+            # be hundreds of times a second on a fast connection
+            now = time.monotonic()
+            if now - last_update[0] < 0.25:
+                return
+            last_update[0] = now
+
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if total and 'downloaded_bytes' in d:
+                progress = d['downloaded_bytes'] / total
+            elif '_percent_str' in d:
+                # Fallback for percentage string
+                try:
+                    progress = float(d['_percent_str'].strip().rstrip('%')) / 100
+                except (ValueError, AttributeError):
+                    return
+            else:
+                return
+
+            # Only wake the loop when at least 1% of new progress accrued
+            if progress - song.download_progress < 0.01:
+                return
+            song.download_progress = progress
+
+            # The hook runs on an executor thread; create_task is only
+            # legal from the loop thread, so hand the coroutine over
+            try:
+                loop.call_soon_threadsafe(asyncio.ensure_future, progress_callback(progress))
+            except RuntimeError:
+                pass  # loop already closed during shutdown
+
         ydl_opts['progress_hooks'] = [progress_hook]
-    
+
     try:
-        loop = asyncio.get_event_loop()
-        
-        def download_func():
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(song.url, download=True)
-                
-                # Get the actual file path
-                if 'filepath' in info:
-                    return Path(info['filepath'])
-                else:
-                    # Fallback: construct path from template
-                    filename = ydl.prepare_filename(info)
-                    # Replace extension with .mp3
-                    base_path = Path(filename).with_suffix('.mp3')
-                    return base_path
-        
         logger.info("Starting download", title=song.title[:50])
-        
-        final_path = await asyncio.wait_for(
-            loop.run_in_executor(download_executor, download_func),
-            timeout=settings.download_timeout
-        )
-        
-        if not final_path.exists():
-            raise AudioDownloadError(f"Downloaded file not found: {final_path}")
+
+        async with _ytdl_semaphore, asyncio.timeout(settings.download_timeout):
+            final_path = await loop.run_in_executor(download_executor, _ydl_download, ydl_opts, song.url)
         
         song.file_path = final_path
         song.download_progress = 1.0
+        song._stat_cache = None  # file just appeared; drop any cached miss
+        try:
+            song.file_size_bytes = final_path.stat().st_size
+        except OSError:
+            song.file_size_bytes = 0
         
         download_time = time.time() - start_time
         file_size_mb = song.file_size_mb
@@ -523,6 +828,22 @@ async def create_now_playing_embed(music_cog) -> discord.Embed:
         return embed
 
     song = music_cog.current_song
+
+    # The refresh tick calls this every second; if nothing visible changed
+    # (time bucketed to 1s), hand back the previously built embed instead
+    # of reassembling all fields
+    cache_key = (
+        id(song),
+        len(music_cog.queue_manager.queue),
+        round(music_cog.get_current_time_seconds()),
+        music_cog.volume,
+        music_cog.repeat_mode,
+        music_cog.is_paused() if hasattr(music_cog, 'is_paused') else False,
+    )
+    cached = getattr(music_cog, '_embed_cache', None)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
     embed = discord.Embed(
         title="🎵 Jetzt läuft",
         description=f"**[{song.title}]({song.url})**",
@@ -584,12 +905,10 @@ async def create_now_playing_embed(music_cog) -> discord.Embed:
     queue_size = len(music_cog.queue_manager.queue)
     if queue_size > 0:
         next_songs = music_cog.queue_manager.get_upcoming_songs(3)
-        next_list = []
-        for i, next_song in enumerate(next_songs, 1):
-            title = next_song.title[:40] + "..." if len(next_song.title) > 40 else next_song.title
-            next_list.append(f"`{i}.` **{title}** `[{next_song.formatted_duration}]`")
-        
-        queue_text = "\n".join(next_list)
+        queue_text = "\n".join(
+            f"`{i}.` **{next_song.display_title}** `[{next_song.formatted_duration}]`"
+            for i, next_song in enumerate(next_songs, 1)
+        )
         if queue_size > 3:
             queue_text += f"\n*... und {queue_size - 3} weitere Songs*"
         
@@ -624,5 +943,7 @@ async def create_now_playing_embed(music_cog) -> discord.Embed:
         text=f"Hinzugefügt vor {int(song.age_minutes)} Min • {song.requester.display_name}",
         icon_url=song.requester.display_avatar.url
     )
-    
+
+    music_cog._embed_cache = (cache_key, embed)
+
     return embed
\ No newline at end of file
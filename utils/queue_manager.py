@@ -1,7 +1,11 @@
-from typing import List, Optional, Dict, Any
+from typing import Deque, List, Optional, Dict, Any
+import os
 import random
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from itertools import islice
+from functools import lru_cache
 from utils.music_helpers import Song
 from utils.exceptions import QueueFullError
 from utils.logger import get_logger
@@ -10,17 +14,60 @@ from config.settings import settings
 
 logger = get_logger('queue_manager')
 
+def _bulk_unlink(paths):
+    """Blocking helper: delete many files in a single executor hop.
+
+    Mass cleanup used to unlink from the event-loop thread, one syscall
+    per song, stalling heartbeats for large queues.
+    """
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error("Failed to cleanup file", file=str(path), error=str(e))
+
 class QueueManager:
     """Enhanced queue manager with persistence, history, and advanced features."""
     
     def __init__(self, max_size: int = None):
-        self.queue: List[Song] = []
+        # deque: get_next_song pops from the left on every track change,
+        # which is O(n) on a list but O(1) here
+        self.queue: Deque[Song] = deque()
         self.max_size = max_size or settings.max_queue_size
         self.history: List[Song] = []
         self.max_history = 100
         self.shuffle_mode = False
         self.original_queue: List[Song] = []  # For unshuffle
+        # Mutators serialize on this lock and never await while the
+        # structures are inconsistent, so read-only methods stay lock-free:
+        # under the single-threaded event loop they always observe a
+        # complete state, and N concurrent UI reads never queue up
         self._queue_lock = asyncio.Lock()
+        # Debounced persistence: mutators only flag the state dirty and a
+        # single background task writes it out, so a burst of adds costs
+        # one serialization instead of one per song
+        self._flush_event = asyncio.Event()
+        self._persist_task: Optional[asyncio.Task] = None
+        # Song dicts and play order persist under separate cache keys, so
+        # order-only changes (shuffle) skip re-serializing every song
+        self._content_dirty = True
+        # Bumped on every mutation; lets read paths memoize against it
+        self._version = 0
+        self._last_persisted_version = -1
+        # user_id -> that user's songs, in add order; per-user lookups
+        # touch only their own entries instead of scanning the queue.
+        # Total duration is maintained alongside so queue stats never
+        # rescan for it
+        self._by_requester: Dict[int, List[Song]] = {}
+        self._total_duration = 0
+        self._info_cache: Optional[tuple] = None
+        # Deferred file deletion: one reaper task drains (deadline, song)
+        # pairs instead of one sleeping task per evicted history entry
+        self._cleanup_queue: Deque[tuple] = deque()
+        self._cleanup_event = asyncio.Event()
+        self._cleanup_task: Optional[asyncio.Task] = None
         
     async def add_song(self, song: Song, position: Optional[int] = None) -> bool:
         """Add song to queue at specified position or end."""
@@ -28,31 +75,40 @@ class QueueManager:
             if len(self.queue) >= self.max_size:
                 raise QueueFullError(f"Queue is full (max {self.max_size} songs)")
             
-            if position is not None and 0 <= position <= len(self.queue):
+            if position == 0:
+                # "Play next" is the common explicit position; O(1) on the
+                # deque instead of shifting the whole queue
+                self.queue.appendleft(song)
+                logger.info("Song added to queue", title=song.title[:50], position=0)
+            elif position is not None and 0 <= position <= len(self.queue):
                 self.queue.insert(position, song)
                 logger.info("Song added to queue", title=song.title[:50], position=position)
             else:
                 self.queue.append(song)
                 logger.info("Song added to queue", title=song.title[:50], position=len(self.queue))
-            
-            await self._save_queue_state()
+
+            self._count_add(song)
+            self._mark_dirty()
             return True
-    
+
+    async def add_song_next(self, song: Song) -> bool:
+        """Queue a song to play right after the current one."""
+        return await self.add_song(song, position=0)
+
     async def add_songs(self, songs: List[Song]) -> int:
         """Add multiple songs to queue, returns number of songs added."""
-        added = 0
         async with self._queue_lock:
-            for song in songs:
-                if len(self.queue) >= self.max_size:
-                    break
-                self.queue.append(song)
-                added += 1
-            
-            if added > 0:
-                logger.info("Multiple songs added to queue", count=added)
-                await self._save_queue_state()
-        
-        return added
+            # One bulk extend instead of a length check and append per song
+            room = self.max_size - len(self.queue)
+            batch = songs[:room] if room > 0 else []
+            if batch:
+                self.queue.extend(batch)
+                for song in batch:
+                    self._count_add(song)
+                logger.info("Multiple songs added to queue", count=len(batch))
+                self._mark_dirty()
+
+            return len(batch)
 
     async def get_next_song(self) -> Optional[Song]:
         """Get next song and move current to history."""
@@ -60,9 +116,10 @@ class QueueManager:
             if not self.queue:
                 return None
             
-            song = self.queue.pop(0)
+            song = self.queue.popleft()
+            self._count_remove(song)
             await self._add_to_history(song)
-            await self._save_queue_state()
+            self._mark_dirty()
             
             logger.debug("Next song retrieved", title=song.title[:50])
             return song
@@ -71,9 +128,11 @@ class QueueManager:
         """Remove song at specific index."""
         async with self._queue_lock:
             if 0 <= index < len(self.queue):
-                song = self.queue.pop(index)
+                song = self.queue[index]
+                del self.queue[index]
+                self._count_remove(song)
                 logger.info("Song removed from queue", title=song.title[:50], index=index)
-                await self._save_queue_state()
+                self._mark_dirty()
                 return song
             return None
     
@@ -82,7 +141,8 @@ class QueueManager:
         async with self._queue_lock:
             if (0 <= from_index < len(self.queue) and 
                 0 <= to_index < len(self.queue)):
-                song = self.queue.pop(from_index)
+                song = self.queue[from_index]
+                del self.queue[from_index]
                 self.queue.insert(to_index, song)
                 logger.info(
                     "Song moved in queue",
@@ -90,21 +150,28 @@ class QueueManager:
                     from_index=from_index,
                     to_index=to_index
                 )
-                await self._save_queue_state()
+                self._mark_dirty()
                 return True
             return False
 
     async def clear(self):
         """Clear the queue and cleanup files."""
         async with self._queue_lock:
-            for song in self.queue:
-                song.cleanup()
+            paths = [song.file_path for song in self.queue if song.file_path]
             self.queue.clear()
             self.original_queue.clear()
+            self._by_requester.clear()
+            self._total_duration = 0
             self.shuffle_mode = False
-            
+
             logger.info("Queue cleared")
-            await self._save_queue_state()
+            self._mark_dirty()
+
+        if paths:
+            # Fire and forget: the UI answer shouldn't wait on disk I/O,
+            # and _bulk_unlink handles its own errors
+            loop = asyncio.get_running_loop()
+            loop.run_in_executor(None, _bulk_unlink, paths)
 
     def is_empty(self) -> bool:
         return len(self.queue) == 0
@@ -114,7 +181,7 @@ class QueueManager:
 
     def get_upcoming_songs(self, count: int) -> List[Song]:
         """Get upcoming songs with limit."""
-        return self.queue[:count]
+        return list(islice(self.queue, count))
     
     async def shuffle(self):
         """Shuffle the queue with ability to unshuffle."""
@@ -124,54 +191,68 @@ class QueueManager:
             
             if not self.shuffle_mode:
                 # Save original order before shuffling
-                self.original_queue = self.queue.copy()
+                self.original_queue = list(self.queue)
                 self.shuffle_mode = True
             
-            random.shuffle(self.queue)
+            # random.shuffle needs indexable swaps; round-trip through a list
+            shuffled = list(self.queue)
+            random.shuffle(shuffled)
+            self.queue = deque(shuffled)
             logger.info("Queue shuffled", size=len(self.queue))
-            await self._save_queue_state()
+            self._mark_dirty(content=False)
     
     async def unshuffle(self):
         """Restore original queue order."""
         async with self._queue_lock:
             if self.shuffle_mode and self.original_queue:
-                # Restore songs that are still in queue
-                current_urls = {song.url for song in self.queue}
+                # Restore songs that are still in queue. Map back to the
+                # live Song objects so state gained since the shuffle
+                # (download path, progress) survives the reorder
+                by_url = {song.url: song for song in self.queue}
                 restored_queue = [
-                    song for song in self.original_queue 
-                    if song.url in current_urls
+                    by_url[song.url]
+                    for song in self.original_queue
+                    if song.url in by_url
                 ]
-                
-                self.queue = restored_queue
+
+                self.queue = deque(restored_queue)
                 self.shuffle_mode = False
                 self.original_queue.clear()
+                self._rebuild_requester_counts()
                 
                 logger.info("Queue unshuffled", size=len(self.queue))
-                await self._save_queue_state()
+                self._mark_dirty(content=False)
     
     def get_queue_info(self) -> Dict[str, Any]:
         """Get comprehensive queue information."""
-        total_duration = sum(song.duration for song in self.queue)
-        avg_duration = total_duration / len(self.queue) if self.queue else 0
-        
-        # Calculate estimated time until each song
+        # UI refresh ticks call this far more often than the queue
+        # changes; reuse the last result until the version moves on
+        if self._info_cache is not None and self._info_cache[0] == self._version:
+            return self._info_cache[1]
+
+        # Totals and requester cardinality are maintained incrementally
+        # by the mutators; only the cumulative start times need a pass
         estimated_times = []
-        cumulative_time = 0
+        elapsed = 0
         for song in self.queue:
-            estimated_times.append(cumulative_time)
-            cumulative_time += song.duration
-        
-        return {
-            'size': len(self.queue),
+            estimated_times.append(elapsed)
+            elapsed += song.duration
+
+        size = len(self.queue)
+        total_duration = self._total_duration
+        info = {
+            'size': size,
             'max_size': self.max_size,
             'total_duration': total_duration,
             'total_duration_formatted': self._format_duration(total_duration),
-            'average_duration': avg_duration,
-            'is_full': len(self.queue) >= self.max_size,
+            'average_duration': total_duration / size if size else 0,
+            'is_full': size >= self.max_size,
             'is_shuffled': self.shuffle_mode,
             'estimated_times': estimated_times,
-            'unique_requesters': len(set(song.requester.id for song in self.queue))
+            'unique_requesters': len(self._by_requester)
         }
+        self._info_cache = (self._version, info)
+        return info
     
     def get_history(self, count: int = 10) -> List[Song]:
         """Get recently played songs."""
@@ -179,63 +260,185 @@ class QueueManager:
     
     def get_user_songs(self, user_id: int) -> List[Song]:
         """Get all songs in queue requested by specific user."""
-        return [song for song in self.queue if song.requester.id == user_id]
-    
+        # Index holds add order, which may trail the queue order after a
+        # shuffle; fine for listings, and O(k) instead of a queue scan
+        return list(self._by_requester.get(user_id, ()))
+
     async def remove_user_songs(self, user_id: int) -> int:
         """Remove all songs from specific user."""
         async with self._queue_lock:
+            if user_id not in self._by_requester:
+                return 0
+
             original_size = len(self.queue)
-            self.queue = [song for song in self.queue if song.requester.id != user_id]
+            self.queue = deque(song for song in self.queue if song.requester.id != user_id)
             removed_count = original_size - len(self.queue)
-            
+            self._rebuild_requester_counts()
+
             if removed_count > 0:
                 logger.info("User songs removed", user_id=user_id, count=removed_count)
-                await self._save_queue_state()
-            
+                self._mark_dirty()
+
             return removed_count
     
     async def _add_to_history(self, song: Song):
         """Add song to history and maintain max size."""
         self.history.append(song)
         if len(self.history) > self.max_history:
-            # Cleanup old song file
             old_song = self.history.pop(0)
             # Don't cleanup immediately, might be in use
-            asyncio.create_task(self._delayed_cleanup(old_song))
-    
-    async def _delayed_cleanup(self, song: Song, delay: int = 300):
-        """Cleanup song file after delay."""
-        await asyncio.sleep(delay)  # Wait 5 minutes
-        song.cleanup()
+            self._schedule_cleanup(old_song)
+
+    def _schedule_cleanup(self, song: Song, delay: float = 300.0):
+        """Hand a song's file to the reaper for deferred deletion."""
+        loop = asyncio.get_running_loop()
+        self._cleanup_queue.append((loop.time() + delay, song))
+        self._cleanup_event.set()
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_reaper())
+
+    async def _cleanup_reaper(self):
+        """Delete deferred files as their deadlines pass.
+
+        A single task serves the whole backlog; entries are appended in
+        deadline order, so the head is always the next one due.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                if not self._cleanup_queue:
+                    self._cleanup_event.clear()
+                    await self._cleanup_event.wait()
+                deadline, song = self._cleanup_queue[0]
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._cleanup_queue.popleft()
+                song.cleanup()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in cleanup reaper", error=str(e))
+                await asyncio.sleep(5)
     
+    def _count_add(self, song: Song):
+        self._by_requester.setdefault(song.requester.id, []).append(song)
+        self._total_duration += song.duration
+
+    def _count_remove(self, song: Song):
+        user_id = song.requester.id
+        songs = self._by_requester.get(user_id)
+        if songs:
+            try:
+                songs.remove(song)
+            except ValueError:
+                pass
+            if not songs:
+                del self._by_requester[user_id]
+        self._total_duration -= song.duration
+
+    def _rebuild_requester_counts(self):
+        """Reindex requesters and duration after a wholesale queue replacement."""
+        by_requester: Dict[int, List[Song]] = {}
+        total = 0
+        for song in self.queue:
+            by_requester.setdefault(song.requester.id, []).append(song)
+            total += song.duration
+        self._by_requester = by_requester
+        self._total_duration = total
+
+    def _mark_dirty(self, content: bool = True):
+        """Record a mutation and flag the state for the background persister.
+
+        Order-only mutations (shuffle/unshuffle) pass content=False so the
+        persister rewrites just the lightweight order key.
+        """
+        self._version += 1
+        if content:
+            self._content_dirty = True
+        self._flush_event.set()
+        if self._persist_task is None or self._persist_task.done():
+            self._persist_task = asyncio.create_task(self._persist_loop())
+
+    async def _persist_loop(self):
+        """Write dirty queue state out, coalescing bursts of mutations."""
+        while True:
+            try:
+                await self._flush_event.wait()
+                # Let a burst of mutations settle before serializing once
+                await asyncio.sleep(0.25)
+                self._flush_event.clear()
+                await self._save_queue_state()
+            except asyncio.CancelledError:
+                # Final flush so shutdown doesn't lose the newest state
+                if self._flush_event.is_set():
+                    await self._save_queue_state()
+                raise
+            except Exception as e:
+                logger.error("Error in queue persist loop", error=str(e))
+                await asyncio.sleep(5)
+
     async def _save_queue_state(self):
-        """Save queue state to cache for persistence."""
+        """Save queue state to cache for persistence.
+
+        Only the snapshot happens under the queue lock; serialization and
+        the cache write run outside it so concurrent queue operations
+        never wait on persistence I/O.
+        """
         try:
-            queue_data = {
-                'songs': [song.to_dict() for song in self.queue],
-                'shuffle_mode': self.shuffle_mode,
-                'timestamp': datetime.now().isoformat()
+            async with self._queue_lock:
+                version = self._version
+                if version == self._last_persisted_version:
+                    return
+                snapshot = list(self.queue)
+                shuffle_mode = self.shuffle_mode
+                content_dirty = self._content_dirty
+                self._content_dirty = False
+
+            if content_dirty:
+                await cache_manager.set(
+                    'queue_songs',
+                    [song.to_dict() for song in snapshot],
+                    ttl=3600
+                )
+            order_data = {
+                'order': [song.url for song in snapshot],
+                'shuffle_mode': shuffle_mode,
+                'timestamp': time.time()
             }
-            await cache_manager.set('queue_state', queue_data, ttl=3600)
+            await cache_manager.set('queue_order', order_data, ttl=3600)
+            self._last_persisted_version = version
         except Exception as e:
+            self._content_dirty = True
             logger.error("Failed to save queue state", error=str(e))
     
     async def load_queue_state(self, bot):
         """Load queue state from cache."""
         try:
-            queue_data = await cache_manager.get('queue_state')
-            if not queue_data:
+            order_data = await cache_manager.get('queue_order')
+            songs_data = await cache_manager.get('queue_songs')
+            if not order_data or songs_data is None:
                 return
             
             # Check if state is not too old (1 hour)
-            saved_time = datetime.fromisoformat(queue_data['timestamp'])
-            if datetime.now() - saved_time > timedelta(hours=1):
+            if time.time() - order_data['timestamp'] > 3600:
                 logger.info("Queue state too old, skipping restore")
                 return
             
+            # Pair order entries back up with their dicts; a multimap keeps
+            # duplicate URLs (same song queued twice) distinct
+            dicts_by_url: Dict[str, list] = {}
+            for song_dict in songs_data:
+                dicts_by_url.setdefault(song_dict['url'], []).append(song_dict)
+
             # Restore songs (need to recreate Song objects with current bot users)
             restored_songs = []
-            for song_dict in queue_data['songs']:
+            for url in order_data['order']:
+                dicts = dicts_by_url.get(url)
+                if not dicts:
+                    continue
+                # Copy: the cached dicts may be shared with live Song objects
+                song_dict = dict(dicts.pop(0) if len(dicts) > 1 else dicts[0])
                 try:
                     # Try to get user from bot
                     user = bot.get_user(song_dict['requester_id'])
@@ -249,28 +452,46 @@ class QueueManager:
                     continue
             
             async with self._queue_lock:
-                self.queue = restored_songs
-                self.shuffle_mode = queue_data.get('shuffle_mode', False)
+                self.queue = deque(restored_songs)
+                self.shuffle_mode = order_data.get('shuffle_mode', False)
+                self._rebuild_requester_counts()
+                self._version += 1
             
             logger.info("Queue state restored", count=len(restored_songs))
             
         except Exception as e:
             logger.error("Failed to load queue state", error=str(e))
     
-    def _format_duration(self, seconds: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_duration(seconds: int) -> str:
         """Format duration in seconds to readable string."""
         if seconds < 3600:
-            minutes = seconds // 60
-            return f"{minutes} Min"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
+            return f"{seconds // 60} Min"
+        hours, rest = divmod(seconds, 3600)
+        return f"{hours}h {rest // 60}m"
     
     async def cleanup_all(self):
         """Cleanup all downloaded files."""
+        if self._persist_task is not None:
+            self._persist_task.cancel()
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+
         async with self._queue_lock:
-            for song in self.queue + self.history:
-                song.cleanup()
+            pending = [song for _, song in self._cleanup_queue]
+            self._cleanup_queue.clear()
+            paths = [
+                song.file_path
+                for song in (*self.queue, *self.history, *pending)
+                if song.file_path
+            ]
+            self.queue.clear()
             self.history.clear()
-            logger.info("All queue files cleaned up")
\ No newline at end of file
+            self._by_requester.clear()
+            self._total_duration = 0
+
+        if paths:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _bulk_unlink, paths)
+        logger.info("All queue files cleaned up")
\ No newline at end of file
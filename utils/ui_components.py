@@ -1,47 +1,55 @@
+import asyncio
 import discord
 from discord.ui import View, Button, Modal, TextInput, Select
 from discord import ButtonStyle, SelectOption
+from itertools import islice
 from typing import Optional, List
 from utils.exceptions import InvalidTimeFormatError
 from utils.logger import get_logger
-from utils.music_helpers import format_duration, format_number
+from utils.music_helpers import format_duration, format_number, parse_time_input
 from config.settings import settings
 
 logger = get_logger('ui_components')
 
+# Resolved once at import; discord.Color construction per render adds up
+_EMBED_COLOR = discord.Color(settings.embed_color)
+
+# A QueueView is built for every queue open, so its buttons reuse
+# prebuilt kwargs instead of rebuilding identical literals each time.
+# The control view needs none of this: it is a process-wide singleton
+_PREV_PAGE_KW = dict(emoji="◀️", style=ButtonStyle.secondary, custom_id="prev_page")
+_NEXT_PAGE_KW = dict(emoji="▶️", style=ButtonStyle.secondary, custom_id="next_page")
+_CLEAR_QUEUE_KW = dict(emoji="🗑️", label="Clear", style=ButtonStyle.danger, custom_id="clear_queue")
+_SHUFFLE_QUEUE_KW = dict(emoji="🔀", label="Shuffle", style=ButtonStyle.secondary, custom_id="shuffle_queue")
+
+# Bounded ingress for heavy component callbacks: the process-wide cap
+# stops one guild's slow path (FFmpeg spawn, file deletion) from starving
+# interactions of every other guild, while the per-guild lock keeps
+# same-guild actions ordered. Validation failures return before acquiring
+# either, so rejected clicks never occupy a slot
+_interaction_semaphore = asyncio.Semaphore(16)
+_guild_locks: dict = {}
+
+def _guild_lock(guild_id) -> asyncio.Lock:
+    lock = _guild_locks.get(guild_id)
+    if lock is None:
+        lock = _guild_locks.setdefault(guild_id, asyncio.Lock())
+    return lock
+
 class MusicControlView(View):
     """Enhanced music control view with modern UI components."""
     
     def __init__(self, music_cog):
-        super().__init__(timeout=300)  # 5 minutes timeout
+        # Persistent: registered once via bot.add_view at cog load, so the
+        # per-song now-playing messages share one view instead of paying
+        # ten button allocations and a timeout task per message
+        super().__init__(timeout=None)
         self.music_cog = music_cog
-        
-        # Row 1: Primary playback controls
-        self.add_item(PlayPauseButton(music_cog))
-        self.add_item(StopButton())
-        self.add_item(SkipButton())
-        self.add_item(VolumeButton())
-        
-        # Row 2: Queue and settings controls
-        self.add_item(RepeatButton(music_cog))
-        self.add_item(ShuffleButton())
-        self.add_item(QueueButton())
-        self.add_item(JumpButton())
-        
-        # Row 3: Additional features
-        self.add_item(AddSongButton())
-        self.add_item(CopyLinkButton())
-
-    async def on_timeout(self):
-        """Called when the view times out."""
-        for item in self.children:
-            item.disabled = True
-        
-        if hasattr(self, 'message') and self.message:
-            try:
-                await self.message.edit(view=self)
-            except discord.NotFound:
-                pass
+
+        # Layout lives in _CONTROL_BUTTON_SPECS; binding the cog here
+        # spares every callback a get_cog lookup on the ack path
+        for button_cls in _CONTROL_BUTTON_SPECS:
+            self.add_item(button_cls(music_cog))
 
 class PlayPauseButton(Button):
     def __init__(self, music_cog):
@@ -55,17 +63,18 @@ class PlayPauseButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        if not interaction.guild.voice_client:
+        vc = interaction.guild.voice_client
+        if not vc:
             await interaction.response.send_message("❌ Bot ist nicht verbunden.", ephemeral=True)
             return
         
-        if interaction.guild.voice_client.is_playing():
-            interaction.guild.voice_client.pause()
+        if vc.is_playing():
+            vc.pause()
             self.music_cog.pause_start = interaction.created_at.timestamp()
             self.emoji = "▶️"
             self.label = "Play"
-        elif interaction.guild.voice_client.is_paused():
-            interaction.guild.voice_client.resume()
+        elif vc.is_paused():
+            vc.resume()
             if self.music_cog.pause_start:
                 self.music_cog.paused_time += interaction.created_at.timestamp() - self.music_cog.pause_start
                 self.music_cog.pause_start = None
@@ -73,9 +82,11 @@ class PlayPauseButton(Button):
             self.label = "Pause"
         
         await interaction.response.edit_message(view=self.view)
+        await self.music_cog._notify_web()
 
 class StopButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="⏹️",
             label="Stop",
@@ -84,15 +95,20 @@ class StopButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog and interaction.guild.voice_client:
-            await music_cog._cleanup(interaction)
-            await interaction.response.send_message("⏹️ Wiedergabe gestoppt.", ephemeral=True)
-        else:
+        if not interaction.guild.voice_client:
             await interaction.response.send_message("❌ Nichts zu stoppen.", ephemeral=True)
+            return
+
+        # Ack before queueing behind the guild lock: waiting out another
+        # holder plus the cleanup REST calls can blow the 3s window
+        await interaction.response.defer(ephemeral=True)
+        async with _interaction_semaphore, _guild_lock(interaction.guild_id):
+            await self.music_cog._cleanup(interaction)
+        await interaction.followup.send("⏹️ Wiedergabe gestoppt.", ephemeral=True)
 
 class SkipButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="⏭️",
             label="Skip",
@@ -101,21 +117,22 @@ class SkipButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        if not interaction.guild.voice_client or not interaction.guild.voice_client.is_playing():
+        vc = interaction.guild.voice_client
+        if not vc or not vc.is_playing():
             await interaction.response.send_message("❌ Nichts zu überspringen.", ephemeral=True)
             return
         
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog and music_cog.current_song:
-            title = music_cog.current_song.title
-            interaction.guild.voice_client.stop()
+        if self.music_cog.current_song:
+            title = self.music_cog.current_song.title
+            vc.stop()
             await interaction.response.send_message(f"⏭️ **{title}** übersprungen.", ephemeral=True)
         else:
-            interaction.guild.voice_client.stop()
+            vc.stop()
             await interaction.response.send_message("⏭️ Song übersprungen.", ephemeral=True)
 
 class VolumeButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="🔊",
             label="Volume",
@@ -124,11 +141,7 @@ class VolumeButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog:
-            await interaction.response.send_modal(VolumeModal(music_cog))
-        else:
-            await interaction.response.send_message("❌ Musik-System nicht verfügbar.", ephemeral=True)
+        await interaction.response.send_modal(VolumeModal(self.music_cog))
 
 class RepeatButton(Button):
     def __init__(self, music_cog):
@@ -143,13 +156,17 @@ class RepeatButton(Button):
     async def callback(self, interaction: discord.Interaction):
         self.music_cog.repeat_mode = not self.music_cog.repeat_mode
         self.style = ButtonStyle.success if self.music_cog.repeat_mode else ButtonStyle.secondary
-        
-        status = "aktiviert" if self.music_cog.repeat_mode else "deaktiviert"
+        self.label = "Repeat: an" if self.music_cog.repeat_mode else "Repeat"
+
+        # One edit carries both the toggle and the confirmation (green
+        # style + label); the extra ephemeral followup cost a second
+        # REST call per click
         await interaction.response.edit_message(view=self.view)
-        await interaction.followup.send(f"🔁 Wiederholung **{status}**.", ephemeral=True)
+        await self.music_cog._notify_web()
 
 class ShuffleButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="🔀",
             label="Shuffle",
@@ -158,19 +175,16 @@ class ShuffleButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog:
-            if music_cog.queue_manager.is_empty():
-                await interaction.response.send_message("❌ Warteschlange ist leer.", ephemeral=True)
-                return
-            
-            await music_cog.queue_manager.shuffle()
-            await interaction.response.send_message("🔀 Warteschlange gemischt.", ephemeral=True)
-        else:
-            await interaction.response.send_message("❌ Musik-System nicht verfügbar.", ephemeral=True)
+        if self.music_cog.queue_manager.is_empty():
+            await interaction.response.send_message("❌ Warteschlange ist leer.", ephemeral=True)
+            return
+        
+        await self.music_cog.queue_manager.shuffle()
+        await interaction.response.send_message("🔀 Warteschlange gemischt.", ephemeral=True)
 
 class QueueButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="📋",
             label="Queue",
@@ -179,16 +193,13 @@ class QueueButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog:
-            view = QueueView(music_cog)
-            embed = view.get_queue_embed()
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-        else:
-            await interaction.response.send_message("❌ Musik-System nicht verfügbar.", ephemeral=True)
+        view = QueueView(self.music_cog)
+        embed = view.get_queue_embed()
+        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
 class JumpButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="⏩",
             label="Jump",
@@ -197,14 +208,14 @@ class JumpButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog and music_cog.current_song:
-            await interaction.response.send_modal(JumpModal(music_cog))
+        if self.music_cog.current_song:
+            await interaction.response.send_modal(JumpModal(self.music_cog))
         else:
             await interaction.response.send_message("❌ Kein Song wird abgespielt.", ephemeral=True)
 
 class AddSongButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="➕",
             label="Add Song",
@@ -213,14 +224,11 @@ class AddSongButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog:
-            await interaction.response.send_modal(AddYouTubeLinkModal(music_cog))
-        else:
-            await interaction.response.send_message("❌ Musik-System nicht verfügbar.", ephemeral=True)
+        await interaction.response.send_modal(AddYouTubeLinkModal(self.music_cog))
 
 class CopyLinkButton(Button):
-    def __init__(self):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
         super().__init__(
             emoji="🔗",
             label="Copy Link",
@@ -229,15 +237,29 @@ class CopyLinkButton(Button):
         )
     
     async def callback(self, interaction: discord.Interaction):
-        music_cog = interaction.client.get_cog('Music')
-        if music_cog and music_cog.current_song:
+        if self.music_cog.current_song:
             await interaction.response.send_message(
-                f"🔗 **Link:** {music_cog.current_song.url}",
+                f"🔗 **Link:** {self.music_cog.current_song.url}",
                 ephemeral=True
             )
         else:
             await interaction.response.send_message("❌ Kein Song wird abgespielt.", ephemeral=True)
 
+# Button layout for MusicControlView in add order (discord.py fills rows
+# five at a time): playback controls, then queue/settings, then extras
+_CONTROL_BUTTON_SPECS = (
+    PlayPauseButton,
+    StopButton,
+    SkipButton,
+    VolumeButton,
+    RepeatButton,
+    ShuffleButton,
+    QueueButton,
+    JumpButton,
+    AddSongButton,
+    CopyLinkButton,
+)
+
 # Modals
 class VolumeModal(Modal):
     """Enhanced volume modal with validation and presets."""
@@ -258,27 +280,35 @@ class VolumeModal(Modal):
         self.add_item(self.volume)
     
     async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+
         try:
             volume = int(self.volume.value)
             if not 0 <= volume <= 100:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "❌ Lautstärke muss zwischen 0 und 100 liegen.",
                     ephemeral=True
                 )
                 return
             
-            self.music_cog.volume = volume / 100
-            if interaction.guild.voice_client and hasattr(interaction.guild.voice_client, 'source'):
-                if interaction.guild.voice_client.source:
-                    interaction.guild.voice_client.source.volume = self.music_cog.volume
+            # Two users submitting at once must not interleave the cog and
+            # source writes; compute once, assign under the lock
+            new_volume = volume / 100
+            async with self.music_cog._volume_lock:
+                self.music_cog.volume = new_volume
+                vc = interaction.guild.voice_client
+                if vc and getattr(vc, 'source', None):
+                    vc.source.volume = new_volume
             
-            await interaction.response.send_message(
+            await self.music_cog._notify_web()
+            
+            await interaction.followup.send(
                 f"🔊 Lautstärke auf **{volume}%** gesetzt.",
                 ephemeral=True
             )
             
         except ValueError:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ Bitte gib eine gültige Zahl ein.",
                 ephemeral=True
             )
@@ -338,57 +368,68 @@ class JumpModal(Modal):
         self.add_item(self.jump_time)
     
     async def on_submit(self, interaction: discord.Interaction):
+        # Ack immediately: spawning the FFmpeg process below can take
+        # longer than Discord's 3-second interaction window
+        await interaction.response.defer(ephemeral=True)
+
         try:
-            from utils.music_helpers import parse_time_input
-            
             target_seconds = parse_time_input(self.jump_time.value)
             
             if not self.music_cog.current_song:
-                await interaction.response.send_message("❌ Kein Song wird abgespielt.", ephemeral=True)
+                await interaction.followup.send("❌ Kein Song wird abgespielt.", ephemeral=True)
                 return
             
             if target_seconds > self.music_cog.current_song.duration:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Zeit ist länger als die Song-Dauer ({format_duration(self.music_cog.current_song.duration)}).",
                     ephemeral=True
                 )
                 return
             
             # Implement jump logic
-            voice_client = interaction.guild.voice_client
-            if voice_client and voice_client.is_playing():
-                voice_client.pause()
-                
-                # Create new audio source with seek
-                audio_source = discord.PCMVolumeTransformer(
-                    discord.FFmpegPCMAudio(
-                        str(self.music_cog.current_song.file_path),
-                        before_options=f"-ss {target_seconds}"
-                    ),
-                    volume=self.music_cog.volume
-                )
-                
-                voice_client.source = audio_source
-                voice_client.resume()
-                
-                # Update timing
-                self.music_cog.seek_position = target_seconds
-                self.music_cog.current_song.start_time = interaction.created_at.timestamp() - target_seconds
-                self.music_cog.paused_time = 0
-                self.music_cog.pause_start = None
-                
-                await interaction.response.send_message(
+            async with _interaction_semaphore, _guild_lock(interaction.guild_id):
+                did_jump = False
+                voice_client = interaction.guild.voice_client
+                if voice_client and voice_client.is_playing():
+                    voice_client.pause()
+                    
+                    # Create new audio source with seek. -ss before the
+                    # input seeks by keyframe instead of decoding up to the
+                    # target; -vn/-threads 1 skip video probing and thread
+                    # spin-up for a single audio stream
+                    audio_source = discord.PCMVolumeTransformer(
+                        discord.FFmpegPCMAudio(
+                            str(self.music_cog.current_song.file_path),
+                            before_options=f"-ss {target_seconds} -noaccurate_seek",
+                            options="-vn -threads 1"
+                        ),
+                        volume=self.music_cog.volume
+                    )
+                    
+                    voice_client.source = audio_source
+                    voice_client.resume()
+                    
+                    # Update timing
+                    self.music_cog.seek_position = target_seconds
+                    self.music_cog.current_song.start_time = interaction.created_at.timestamp() - target_seconds
+                    self.music_cog.paused_time = 0
+                    self.music_cog.pause_start = None
+                    did_jump = True
+
+            if did_jump:
+                await self.music_cog._notify_web()
+                await interaction.followup.send(
                     f"⏩ Zu **{format_duration(target_seconds)}** gesprungen.",
                     ephemeral=True
                 )
             else:
-                await interaction.response.send_message("❌ Kein Song wird abgespielt.", ephemeral=True)
+                await interaction.followup.send("❌ Kein Song wird abgespielt.", ephemeral=True)
                 
         except InvalidTimeFormatError as e:
-            await interaction.response.send_message(f"❌ {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ {str(e)}", ephemeral=True)
         except Exception as e:
             logger.error("Error jumping to time", error=str(e))
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ Fehler beim Springen: {str(e)}",
                 ephemeral=True
             )
@@ -412,45 +453,101 @@ class QueueView(View):
         # Add queue management select menu if queue has items
         if not music_cog.queue_manager.is_empty():
             self.add_item(QueueManagementSelect(music_cog))
-    
+
+        # Rendered pages keyed by (queue version, page); stale entries
+        # die with the view, so no explicit invalidation is needed
+        self._embed_cache = {}
+        # Static skeleton copied per render instead of rebuilding the
+        # Embed (and its color) from scratch
+        self._embed_template = discord.Embed(
+            title="📋 Musik-Warteschlange",
+            color=_EMBED_COLOR
+        )
+        # Page-flip coalescing: rapid clicks only move _pending_page and
+        # the last scheduled flush delivers a single message edit
+        self._pending_page: Optional[int] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Skeleton plus stats/current/status fields, rebuilt only when the
+        # queue version moves; page renders just patch description+footer
+        self._base_embed: Optional[discord.Embed] = None
+        self._base_version: Optional[int] = None
+
+    def schedule_page_flush(self, interaction: discord.Interaction, page: int):
+        """Register a page change and (re)arm the debounced edit."""
+        self._pending_page = page
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = asyncio.create_task(self._flush_page(interaction))
+
+    async def _flush_page(self, interaction: discord.Interaction):
+        try:
+            await asyncio.sleep(0.12)
+            self.page = self._pending_page
+            self._pending_page = None
+            await interaction.edit_original_response(embed=self.get_queue_embed(), view=self)
+        except asyncio.CancelledError:
+            # Superseded by a newer click within the window
+            pass
+        except discord.NotFound:
+            pass
+
     def get_queue_embed(self) -> discord.Embed:
         """Generate enhanced queue embed for current page."""
         queue = self.music_cog.queue_manager.queue
         queue_info = self.music_cog.queue_manager.get_queue_info()
-        
-        embed = discord.Embed(
-            title="📋 Musik-Warteschlange",
-            color=discord.Color(settings.embed_color)
-        )
-        
+        total_pages = (len(queue) - 1) // self.per_page + 1 if queue else 1
+
+        # Gray out boundary buttons so dead clicks never leave the client;
+        # runs before the cache check because page moves on cache hits too
+        self.children[0].disabled = self.page <= 0
+        self.children[1].disabled = self.page >= total_pages - 1
+
+        cache_key = (self.music_cog.queue_manager._version, self.page)
+        cached = self._embed_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if not queue:
+            embed = self._embed_template.copy()
             embed.description = "Die Warteschlange ist leer.\nVerwende `/play` um Songs hinzuzufügen!"
             embed.set_footer(text="Tipp: Du kannst auch YouTube-Playlists hinzufügen!")
             return embed
-        
+
+        version = self.music_cog.queue_manager._version
+        if self._base_embed is None or self._base_version != version:
+            self._base_embed = self._build_base_embed(queue_info)
+            self._base_version = version
+        embed = self._base_embed.copy()
+
         # Calculate pagination
-        total_pages = (len(queue) - 1) // self.per_page + 1
         start_idx = self.page * self.per_page
         end_idx = start_idx + self.per_page
-        page_songs = queue[start_idx:end_idx]
-        
-        # Build queue list
-        queue_text = []
-        for i, song in enumerate(page_songs, start=start_idx + 1):
-            duration = format_duration(song.duration)
-            title = song.title[:35] + "..." if len(song.title) > 35 else song.title
-            
-            # Add status indicators
-            status = ""
-            if song.is_downloaded:
-                status = "✅"
-            else:
-                status = f"⏳ {int(song.download_progress * 100)}%"
-            
-            queue_text.append(f"`{i:2d}.` **{title}** `[{duration}]` {status}")
-        
-        embed.description = "\n".join(queue_text)
-        
+        # deque doesn't support slicing
+        page_songs = list(islice(queue, start_idx, end_idx))
+        
+        # Build queue list: the title/duration fragment is cached on the
+        # Song, only position and download status vary per render; one
+        # f-string per row feeds the join directly with no interim list
+        statuses = (
+            "✅" if song.is_downloaded else f"⏳ {int(song.download_progress * 100)}%"
+            for song in page_songs
+        )
+        embed.description = "\n".join(
+            f"`{i:2d}.` {song.queue_line} {status}"
+            for i, (song, status) in enumerate(zip(page_songs, statuses), start=start_idx + 1)
+        )
+        embed.set_footer(text=f"Seite {self.page + 1}/{total_pages} • {len(queue)} Songs insgesamt")
+
+        if len(self._embed_cache) > 64:
+            self._embed_cache.clear()
+        self._embed_cache[cache_key] = embed
+
+        return embed
+
+    def _build_base_embed(self, queue_info) -> discord.Embed:
+        """Skeleton plus the three stats fields shared by all pages."""
+        embed = self._embed_template.copy()
+
         # Enhanced statistics
         embed.add_field(
             name="📊 Statistiken",
@@ -459,17 +556,17 @@ class QueueView(View):
                   f"**Anfrager:** {queue_info['unique_requesters']}",
             inline=True
         )
-        
+
         # Current song info
         if self.music_cog.current_song:
             current_time = self.music_cog.get_current_time()
             embed.add_field(
                 name="🎵 Aktuell",
-                value=f"**{self.music_cog.current_song.title[:30]}**\n"
+                value=f"**{self.music_cog.current_song.short_title(30)}**\n"
                       f"⏰ {current_time}/{self.music_cog.current_song.formatted_duration}",
                 inline=True
             )
-        
+
         # Queue status
         status_text = []
         if queue_info['is_shuffled']:
@@ -478,50 +575,43 @@ class QueueView(View):
             status_text.append("🔁 Wiederholung")
         if queue_info['is_full']:
             status_text.append("⚠️ Voll")
-        
+
         if status_text:
             embed.add_field(
                 name="⚙️ Status",
                 value=" • ".join(status_text),
                 inline=True
             )
-        
-        embed.set_footer(text=f"Seite {self.page + 1}/{total_pages} • {len(queue)} Songs insgesamt")
-        
+
         return embed
 
 class PreviousPageButton(Button):
     def __init__(self):
-        super().__init__(emoji="◀️", style=ButtonStyle.secondary, custom_id="prev_page")
+        super().__init__(**_PREV_PAGE_KW)
     
     async def callback(self, interaction: discord.Interaction):
         view: QueueView = self.view
-        if view.page > 0:
-            view.page -= 1
-            embed = view.get_queue_embed()
-            await interaction.response.edit_message(embed=embed, view=view)
-        else:
-            await interaction.response.defer()
+        await interaction.response.defer()
+        target = view._pending_page if view._pending_page is not None else view.page
+        if target > 0:
+            view.schedule_page_flush(interaction, target - 1)
 
 class NextPageButton(Button):
     def __init__(self):
-        super().__init__(emoji="▶️", style=ButtonStyle.secondary, custom_id="next_page")
+        super().__init__(**_NEXT_PAGE_KW)
     
     async def callback(self, interaction: discord.Interaction):
         view: QueueView = self.view
+        await interaction.response.defer()
         queue = view.music_cog.queue_manager.queue
         total_pages = (len(queue) - 1) // view.per_page + 1 if queue else 1
-        
-        if view.page < total_pages - 1:
-            view.page += 1
-            embed = view.get_queue_embed()
-            await interaction.response.edit_message(embed=embed, view=view)
-        else:
-            await interaction.response.defer()
+        target = view._pending_page if view._pending_page is not None else view.page
+        if target < total_pages - 1:
+            view.schedule_page_flush(interaction, target + 1)
 
 class ClearQueueButton(Button):
     def __init__(self):
-        super().__init__(emoji="🗑️", label="Clear", style=ButtonStyle.danger, custom_id="clear_queue")
+        super().__init__(**_CLEAR_QUEUE_KW)
     
     async def callback(self, interaction: discord.Interaction):
         view: QueueView = self.view
@@ -529,13 +619,16 @@ class ClearQueueButton(Button):
             await interaction.response.send_message("❌ Warteschlange ist bereits leer.", ephemeral=True)
             return
         
-        await view.music_cog.queue_manager.clear()
-        embed = view.get_queue_embed()
-        await interaction.response.edit_message(embed=embed, view=view)
+        # Ack before the clear: file deletion can outlast the 3s window
+        await interaction.response.defer()
+        async with _interaction_semaphore, _guild_lock(interaction.guild_id):
+            await view.music_cog.queue_manager.clear()
+            embed = view.get_queue_embed()
+        await interaction.edit_original_response(embed=embed, view=view)
 
 class ShuffleQueueButton(Button):
     def __init__(self):
-        super().__init__(emoji="🔀", label="Shuffle", style=ButtonStyle.secondary, custom_id="shuffle_queue")
+        super().__init__(**_SHUFFLE_QUEUE_KW)
     
     async def callback(self, interaction: discord.Interaction):
         view: QueueView = self.view
@@ -543,9 +636,11 @@ class ShuffleQueueButton(Button):
             await interaction.response.send_message("❌ Warteschlange ist leer.", ephemeral=True)
             return
         
-        await view.music_cog.queue_manager.shuffle()
-        embed = view.get_queue_embed()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.defer()
+        async with _interaction_semaphore, _guild_lock(interaction.guild_id):
+            await view.music_cog.queue_manager.shuffle()
+            embed = view.get_queue_embed()
+        await interaction.edit_original_response(embed=embed, view=view)
 
 class QueueManagementSelect(Select):
     """Select menu for queue management actions."""
@@ -581,10 +676,32 @@ class QueueManagementSelect(Select):
         )
     
     async def callback(self, interaction: discord.Interaction):
+        # The queue may have emptied since the menu was rendered; a
+        # Select with zero options is rejected by Discord on send
+        if self.values[0] in ("remove_song", "move_song") and self.music_cog.queue_manager.size() == 0:
+            await interaction.response.send_message("❌ Die Warteschlange ist leer.", ephemeral=True)
+            return
+        
         if self.values[0] == "remove_song":
-            await interaction.response.send_modal(RemoveSongModal(self.music_cog))
+            # A select beats typing a position, but Discord caps selects
+            # at 25 options; longer queues keep the modal
+            if self.music_cog.queue_manager.size() <= 25:
+                await interaction.response.send_message(
+                    "🗑️ Wähle den Song, der entfernt werden soll:",
+                    view=RemoveSelectView(self.music_cog),
+                    ephemeral=True
+                )
+            else:
+                await interaction.response.send_modal(RemoveSongModal(self.music_cog))
         elif self.values[0] == "move_song":
-            await interaction.response.send_modal(MoveSongModal(self.music_cog))
+            if self.music_cog.queue_manager.size() <= 25:
+                await interaction.response.send_message(
+                    "↕️ Wähle Song und Zielposition:",
+                    view=MoveSelectView(self.music_cog),
+                    ephemeral=True
+                )
+            else:
+                await interaction.response.send_modal(MoveSongModal(self.music_cog))
         elif self.values[0] == "show_my_songs":
             user_songs = self.music_cog.queue_manager.get_user_songs(interaction.user.id)
             if not user_songs:
@@ -593,13 +710,12 @@ class QueueManagementSelect(Select):
             
             embed = discord.Embed(
                 title=f"👤 Deine Songs ({len(user_songs)})",
-                color=discord.Color(settings.embed_color)
+                color=_EMBED_COLOR
             )
             
             song_list = []
             for i, song in enumerate(user_songs[:10], 1):  # Limit to 10
-                title = song.title[:40] + "..." if len(song.title) > 40 else song.title
-                song_list.append(f"`{i}.` **{title}** `[{song.formatted_duration}]`")
+                song_list.append(f"`{i}.` **{song.short_title(40)}** `[{song.formatted_duration}]`")
             
             embed.description = "\n".join(song_list)
             if len(user_songs) > 10:
@@ -607,6 +723,101 @@ class QueueManagementSelect(Select):
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
+class RemoveSelectView(View):
+    """Pick-a-song removal without the modal round-trip (queues ≤ 25)."""
+
+    def __init__(self, music_cog):
+        super().__init__(timeout=60)
+        self.add_item(RemoveSongSelect(music_cog))
+
+class RemoveSongSelect(Select):
+    def __init__(self, music_cog):
+        self.music_cog = music_cog
+        songs = music_cog.queue_manager.get_upcoming_songs(25)
+        options = [
+            SelectOption(label=f"{i + 1}. {song.title[:80]}", value=str(i))
+            for i, song in enumerate(songs)
+        ]
+        super().__init__(
+            placeholder="Song zum Entfernen wählen...",
+            options=options,
+            custom_id="remove_song_select"
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        removed_song = await self.music_cog.queue_manager.remove_song(int(self.values[0]))
+        if removed_song:
+            await interaction.followup.send(
+                f"🗑️ **{removed_song.title}** wurde entfernt.",
+                ephemeral=True
+            )
+        else:
+            await interaction.followup.send("❌ Fehler beim Entfernen.", ephemeral=True)
+
+class MoveSelectView(View):
+    """Two selects (song, target position) replacing the move modal (queues ≤ 25)."""
+
+    def __init__(self, music_cog):
+        super().__init__(timeout=60)
+        self.music_cog = music_cog
+        self.from_index: Optional[int] = None
+        self.to_index: Optional[int] = None
+
+        songs = music_cog.queue_manager.get_upcoming_songs(25)
+        self.add_item(MoveFromSelect(songs))
+        self.add_item(MoveToSelect(len(songs)))
+
+    async def try_move(self, interaction: discord.Interaction):
+        """Perform the move once both selections are in."""
+        if self.from_index is None or self.to_index is None:
+            await interaction.response.defer()
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        success = await self.music_cog.queue_manager.move_song(self.from_index, self.to_index)
+        if success:
+            await interaction.followup.send(
+                f"↕️ Song von Position {self.from_index + 1} zu {self.to_index + 1} verschoben.",
+                ephemeral=True
+            )
+        else:
+            await interaction.followup.send("❌ Fehler beim Verschieben.", ephemeral=True)
+
+class MoveFromSelect(Select):
+    def __init__(self, songs):
+        options = [
+            SelectOption(label=f"{i + 1}. {song.title[:80]}", value=str(i))
+            for i, song in enumerate(songs)
+        ]
+        super().__init__(
+            placeholder="Song wählen...",
+            options=options,
+            custom_id="move_from_select"
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        view: MoveSelectView = self.view
+        view.from_index = int(self.values[0])
+        await view.try_move(interaction)
+
+class MoveToSelect(Select):
+    def __init__(self, size):
+        options = [
+            SelectOption(label=f"Position {i + 1}", value=str(i))
+            for i in range(size)
+        ]
+        super().__init__(
+            placeholder="Zielposition wählen...",
+            options=options,
+            custom_id="move_to_select"
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        view: MoveSelectView = self.view
+        view.to_index = int(self.values[0])
+        await view.try_move(interaction)
+
 class RemoveSongModal(Modal):
     def __init__(self, music_cog):
         super().__init__(title="🗑️ Song entfernen")
@@ -622,10 +833,12 @@ class RemoveSongModal(Modal):
         self.add_item(self.position)
     
     async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+
         try:
             pos = int(self.position.value)
             if pos < 1 or pos > self.music_cog.queue_manager.size():
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Position muss zwischen 1 und {self.music_cog.queue_manager.size()} liegen.",
                     ephemeral=True
                 )
@@ -633,15 +846,15 @@ class RemoveSongModal(Modal):
             
             removed_song = await self.music_cog.queue_manager.remove_song(pos - 1)
             if removed_song:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"🗑️ **{removed_song.title}** wurde entfernt.",
                     ephemeral=True
                 )
             else:
-                await interaction.response.send_message("❌ Fehler beim Entfernen.", ephemeral=True)
+                await interaction.followup.send("❌ Fehler beim Entfernen.", ephemeral=True)
                 
         except ValueError:
-            await interaction.response.send_message("❌ Bitte gib eine gültige Zahl ein.", ephemeral=True)
+            await interaction.followup.send("❌ Bitte gib eine gültige Zahl ein.", ephemeral=True)
 
 class MoveSongModal(Modal):
     def __init__(self, music_cog):
@@ -667,26 +880,28 @@ class MoveSongModal(Modal):
         self.add_item(self.to_pos)
     
     async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+
         try:
             from_pos = int(self.from_pos.value) - 1
             to_pos = int(self.to_pos.value) - 1
             
             if not (0 <= from_pos < self.music_cog.queue_manager.size()):
-                await interaction.response.send_message("❌ Ungültige Ausgangsposition.", ephemeral=True)
+                await interaction.followup.send("❌ Ungültige Ausgangsposition.", ephemeral=True)
                 return
             
             if not (0 <= to_pos < self.music_cog.queue_manager.size()):
-                await interaction.response.send_message("❌ Ungültige Zielposition.", ephemeral=True)
+                await interaction.followup.send("❌ Ungültige Zielposition.", ephemeral=True)
                 return
             
             success = await self.music_cog.queue_manager.move_song(from_pos, to_pos)
             if success:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"↕️ Song von Position {from_pos + 1} zu {to_pos + 1} verschoben.",
                     ephemeral=True
                 )
             else:
-                await interaction.response.send_message("❌ Fehler beim Verschieben.", ephemeral=True)
+                await interaction.followup.send("❌ Fehler beim Verschieben.", ephemeral=True)
                 
         except ValueError:
-            await interaction.response.send_message("❌ Bitte gib gültige Zahlen ein.", ephemeral=True)
\ No newline at end of file
+            await interaction.followup.send("❌ Bitte gib gültige Zahlen ein.", ephemeral=True)
\ No newline at end of file
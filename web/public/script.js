@@ -104,6 +104,11 @@ function initializeSocketListeners() {
         updateUI();
     });
 
+    socket.on('bot-state-delta', (delta) => {
+        botState = { ...botState, ...delta };
+        updateUI();
+    });
+
     socket.on('new-log', (logEntry) => {
         addLogEntry(logEntry);
     });
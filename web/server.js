@@ -151,6 +151,36 @@ io.on('connection', (socket) => {
         socket.broadcast.emit('bot-state', botState);
     });
     
+    // Full snapshot from the Python bot (sent on connect)
+    socket.on('bot-state', (data) => {
+        botState = { ...botState, ...data };
+        socket.broadcast.emit('bot-state', botState);
+    });
+    
+    // Incremental updates: merge into the cached state so late-joining
+    // clients get a complete snapshot, relay only the changed fields
+    socket.on('bot-state-delta', (delta) => {
+        botState = { ...botState, ...delta };
+        socket.broadcast.emit('bot-state-delta', delta);
+    });
+    
+    // Slim liveness payload between state pushes
+    socket.on('bot-heartbeat', (stats) => {
+        botState = { ...botState, ...stats };
+        socket.broadcast.emit('bot-state-delta', stats);
+    });
+    
+    // Debounced song/queue notifications from the Python bot
+    socket.on('song-update', (song) => {
+        botState.currentSong = song;
+        socket.broadcast.emit('song-update', song);
+    });
+    
+    socket.on('queue-update', (queue) => {
+        botState.queue = queue;
+        socket.broadcast.emit('queue-update', queue);
+    });
+    
     // Handle log updates from Python
     socket.on('new-log', (logEntry) => {
         logs.push({
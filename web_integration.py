@@ -6,8 +6,16 @@ Verbindet den Discord Bot mit dem Web Interface über Socket.IO
 import asyncio
 import threading
 import time
+from itertools import islice
 import psutil
 import json
+
+try:
+    # Optional: beschleunigt das Encoding der Socket.IO-Frames (Queue-
+    # Payloads mit bis zu 50 Einträgen) gegenüber stdlib json deutlich
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, Any, Optional
 from socketio import AsyncClient
 from utils.logger import get_logger
@@ -15,15 +23,100 @@ from config.settings import settings
 
 logger = get_logger('web_integration')
 
+# Token-Bucket für eingehende Web-Kommandos: Nachfüllrate pro Sekunde
+# und Burst-Obergrenze
+_CMD_RATE = 2.0
+_CMD_BURST = 5.0
+
+
+class _OrjsonPacker:
+    """json-Modul-Shim für socketio; Engine.IO erwartet str-Payloads."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    loads = staticmethod(json.loads if orjson is None else orjson.loads)
+
+
+class _MockContext:
+    """Minimaler Context-Ersatz für Web-Kommandos; kein echter Versand."""
+
+    def __init__(self, guild, channel, bot):
+        self.guild = guild
+        self.channel = channel
+        self.bot = bot
+        self.voice_client = guild.voice_client
+        self.author = bot.user  # Use bot as author
+
+    async def send(self, content=None, **kwargs):
+        # Don't actually send messages for web commands
+        pass
+
+
 class WebIntegration:
     """Integration zwischen Discord Bot und Web Interface."""
     
     def __init__(self, bot):
         self.bot = bot
-        self.sio = AsyncClient()
+        # Verbindungsabbrüche behandelt der Client selbst: unbegrenzte
+        # Versuche mit 1-30s Backoff und Jitter
+        client_kwargs: Dict[str, Any] = {
+            'reconnection': True,
+            'reconnection_attempts': 0,
+            'reconnection_delay': 1,
+            'reconnection_delay_max': 30,
+            'randomization_factor': 0.5,
+        }
+        if orjson is not None:
+            client_kwargs['json'] = _OrjsonPacker
+        self.sio = AsyncClient(**client_kwargs)
         self.connected = False
         self.web_server_url = f"http://localhost:{settings.web_port}"
         self.update_task: Optional[asyncio.Task] = None
+        self._connect_task: Optional[asyncio.Task] = None
+        # Push statt Polling: Bot-Events setzen das Flag, der Update-Task
+        # sendet nur dann den vollen Zustand; sonst nur ein Heartbeat
+        self._dirty = asyncio.Event()
+        # Letzter gesendeter Zustand für Delta-Emits; die Queue wird über
+        # einen URL-Hash verglichen statt Feld für Feld
+        self._last_state: Dict[str, Any] = {}
+        self._last_queue_hash: Optional[int] = None
+        # Wiederverwendetes Process-Handle; der erste cpu_percent(None)-Aufruf
+        # liefert 0.0 und dient nur zum Starten des Messintervalls
+        self._proc = psutil.Process()
+        self._proc.cpu_percent(None)
+        # CPU/RAM werden auf festem 5s-Takt gesampelt; Emits lesen nur den
+        # letzten Wert — cpu_percent pro Emit wäre bei ereignisgetriebenen
+        # Pushes ein Prozentwert über ein beliebig kurzes Intervall
+        self._sys_stats = {'cpu': 0.0, 'memory': 0.0}
+        self._sys_task: Optional[asyncio.Task] = None
+        # Notify-Bursts (Playlist-Import, clear, shuffle) werden über ein
+        # 50ms-Fenster zu einem einzigen Emit pro Kanal zusammengefasst
+        self._song_dirty = False
+        self._queue_dirty = False
+        self._pending_song = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Music-Cog-Referenz, einmal aufgelöst statt pro Emit per get_cog
+        self._music_cog = None
+        # Gebundene emit-Methode spart zwei Attribut-Lookups pro Push
+        self._emit = self.sio.emit
+        # Rate-Limit-Zustand für 'bot-command' (Tokens, letzter Refill)
+        self._cmd_tokens = _CMD_BURST
+        self._cmd_tokens_ts = time.monotonic()
+        # Kommando-Dispatch über Dict-Lookup statt if/elif-Kette
+        self._cmd_table = {
+            'play': self._cmd_play,
+            'skip': self._cmd_skip,
+            'pause': self._cmd_pause,
+            'stop': self._cmd_stop,
+            'volume': self._cmd_volume,
+            'shuffle': self._cmd_shuffle,
+            'clear': self._cmd_clear,
+            'remove': self._cmd_remove,
+            'repeat': self._cmd_repeat,
+            'seek': self._cmd_seek,
+        }
         
         # Setup event handlers
         self.setup_socket_handlers()
@@ -49,6 +142,19 @@ class WebIntegration:
                 command = data.get('command')
                 args = data.get('args', [])
                 
+                # Flutschutz: begrenzte Event-Loop-Arbeit pro Sekunde,
+                # egal wie schnell die Gegenseite sendet
+                now = time.monotonic()
+                self._cmd_tokens = min(
+                    _CMD_BURST,
+                    self._cmd_tokens + (now - self._cmd_tokens_ts) * _CMD_RATE
+                )
+                self._cmd_tokens_ts = now
+                if self._cmd_tokens < 1.0:
+                    logger.warning("Web command dropped (rate limit)", command=command)
+                    return
+                self._cmd_tokens -= 1.0
+                
                 logger.info("Received web command", command=command, args=args)
                 
                 # Find a guild with voice connection or use first guild
@@ -72,7 +178,7 @@ class WebIntegration:
                     return
                 
                 # Get music cog
-                music_cog = self.bot.get_cog('Music')
+                music_cog = self._get_music_cog()
                 if not music_cog:
                     logger.error("Music cog not found")
                     return
@@ -99,118 +205,201 @@ class WebIntegration:
             logger.info("Settings update received", settings=data)
             # Here you could update bot settings if needed
     
+    @staticmethod
+    async def _cmd_play(music_cog, ctx, args):
+        if args:
+            await music_cog.play(ctx, query=' '.join(args))
+
+    @staticmethod
+    async def _cmd_skip(music_cog, ctx, args):
+        await music_cog.skip(ctx)
+
+    @staticmethod
+    async def _cmd_pause(music_cog, ctx, args):
+        await music_cog.pause(ctx)
+
+    @staticmethod
+    async def _cmd_stop(music_cog, ctx, args):
+        await music_cog.stop(ctx)
+
+    @staticmethod
+    async def _cmd_volume(music_cog, ctx, args):
+        if args:
+            await music_cog.volume(ctx, volume=int(args[0]))
+
+    @staticmethod
+    async def _cmd_shuffle(music_cog, ctx, args):
+        await music_cog.shuffle(ctx)
+
+    @staticmethod
+    async def _cmd_clear(music_cog, ctx, args):
+        await music_cog.clear_queue(ctx)
+
+    @staticmethod
+    async def _cmd_remove(music_cog, ctx, args):
+        if args:
+            await music_cog.remove(ctx, index=int(args[0]))
+
+    @staticmethod
+    async def _cmd_repeat(music_cog, ctx, args):
+        await music_cog.repeat(ctx)
+
+    @staticmethod
+    async def _cmd_seek(music_cog, ctx, args):
+        # Implement seek functionality if available
+        pass
+
     async def execute_web_command(self, music_cog, guild, channel, command: str, args: list):
         """Execute a command from the web interface."""
         try:
-            # Create a mock context
-            class MockContext:
-                def __init__(self, guild, channel, bot):
-                    self.guild = guild
-                    self.channel = channel
-                    self.bot = bot
-                    self.voice_client = guild.voice_client
-                    self.author = bot.user  # Use bot as author
-                
-                async def send(self, content=None, **kwargs):
-                    # Don't actually send messages for web commands
-                    pass
-            
-            ctx = MockContext(guild, channel, self.bot)
+            ctx = _MockContext(guild, channel, self.bot)
             
-            # Execute command based on type
-            if command == 'play' and args:
-                await music_cog.play(ctx, query=' '.join(args))
-            elif command == 'skip':
-                await music_cog.skip(ctx)
-            elif command == 'pause':
-                await music_cog.pause(ctx)
-            elif command == 'stop':
-                await music_cog.stop(ctx)
-            elif command == 'volume' and args:
-                await music_cog.volume(ctx, volume=int(args[0]))
-            elif command == 'shuffle':
-                await music_cog.shuffle(ctx)
-            elif command == 'clear':
-                await music_cog.clear_queue(ctx)
-            elif command == 'remove' and args:
-                await music_cog.remove(ctx, index=int(args[0]))
-            elif command == 'repeat':
-                await music_cog.repeat(ctx)
-            elif command == 'seek' and args:
-                # Implement seek functionality if available
-                pass
-            else:
+            handler = self._cmd_table.get(command)
+            if handler is None:
                 logger.warning("Unknown web command", command=command)
+            else:
+                await handler(music_cog, ctx, args)
             
-            # Send updated state after command
-            await asyncio.sleep(0.5)  # Small delay to let command complete
-            await self.send_bot_state()
+            # Der Update-Task und die Notify-Hooks pushen den Zustand;
+            # ein direkter Emit hier würde doppelt senden
+            self._dirty.set()
             
         except Exception as e:
             logger.error("Error executing web command", command=command, error=str(e))
     
     async def start(self):
         """Start the web integration."""
-        try:
-            await self.sio.connect(self.web_server_url)
-            
-            # Start periodic updates
-            self.update_task = asyncio.create_task(self.periodic_updates())
-            
-            logger.info("Web integration started")
-            
-        except Exception as e:
-            logger.error("Failed to start web integration", error=str(e))
+        self._music_cog = self.bot.get_cog('Music')
+        self.update_task = asyncio.create_task(self.periodic_updates())
+        self._sys_task = asyncio.create_task(self._sample_sys())
+        self._connect_task = asyncio.create_task(self._connect_with_backoff())
+        logger.info("Web integration started")
+
+    async def _connect_with_backoff(self):
+        """Establish the initial connection, retrying with backoff.
+
+        The built-in reconnection only kicks in after a connection was
+        established once; a web server that comes up after the bot
+        would otherwise leave the integration dead forever.
+        """
+        delay = 1.0
+        while True:
+            try:
+                await self.sio.connect(self.web_server_url)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Web interface not reachable, retrying",
+                    delay=delay, error=str(e)
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
     
     async def stop(self):
         """Stop the web integration."""
         if self.update_task:
             self.update_task.cancel()
         
+        if self._sys_task:
+            self._sys_task.cancel()
+        
+        if self._connect_task:
+            self._connect_task.cancel()
+        
         if self.connected:
             await self.sio.disconnect()
         
         logger.info("Web integration stopped")
     
+    def _get_music_cog(self):
+        """Resolve and cache the Music cog on first use."""
+        cog = self._music_cog
+        if cog is None:
+            cog = self._music_cog = self.bot.get_cog('Music')
+        return cog
+
+    def invalidate_cog_cache(self):
+        """Drop the cached cog reference (after an admin reload)."""
+        self._music_cog = None
+
+    def mark_dirty(self):
+        """Flag that bot state changed and should be pushed."""
+        self._dirty.set()
+
     async def periodic_updates(self):
-        """Send periodic updates to web interface."""
+        """Push state on change; fall back to a slim 60s heartbeat."""
         while True:
             try:
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=60)
+                except asyncio.TimeoutError:
+                    # Nothing changed in a minute — uptime/CPU only
+                    if self.connected:
+                        await self.send_heartbeat()
+                    continue
+
+                self._dirty.clear()
                 if self.connected:
                     await self.send_bot_state()
-                await asyncio.sleep(10)  # Update every 10 seconds
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Error in periodic updates", error=str(e))
                 await asyncio.sleep(30)  # Wait longer on error
+
+    async def _sample_sys(self):
+        """Sample CPU and memory on a fixed cadence off the emit path."""
+        while True:
+            try:
+                await asyncio.sleep(5)
+                self._sys_stats['cpu'] = self._proc.cpu_percent(None)
+                self._sys_stats['memory'] = self._proc.memory_info().rss >> 20
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error sampling system stats", error=str(e))
+
+    async def send_heartbeat(self):
+        """Send a minimal liveness payload between state pushes."""
+        try:
+            await self._emit('bot-heartbeat', {
+                'uptime': time.time() - self.bot.start_time if hasattr(self.bot, 'start_time') else 0,
+                'memory': self._sys_stats['memory'],
+                'cpu': self._sys_stats['cpu']
+            })
+        except Exception as e:
+            logger.error("Error sending heartbeat", error=str(e))
     
     async def send_initial_state(self):
         """Send initial bot state to web interface."""
-        await self.send_bot_state()
+        await self.send_bot_state(full=True)
         await self.send_recent_logs()
     
-    async def send_bot_state(self):
-        """Send current bot state to web interface."""
+    async def send_bot_state(self, full: bool = False):
+        """Send current bot state to web interface.
+
+        By default only changed fields go out as 'bot-state-delta'; a
+        full 'bot-state' snapshot is reserved for (re)connects.
+        """
+        if not self.connected:
+            return
+        
         try:
-            music_cog = self.bot.get_cog('Music')
+            music_cog = self._get_music_cog()
             
-            # Get system info
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            cpu_percent = process.cpu_percent()
             
             # Build state
             state = {
                 'status': 'online' if self.bot.is_ready() else 'offline',
                 'guilds': len(self.bot.guilds),
-                'users': sum(guild.member_count for guild in self.bot.guilds),
+                'users': self.bot._cached_user_total,
                 'uptime': time.time() - self.bot.start_time if hasattr(self.bot, 'start_time') else 0,
-                'memory': memory_info.rss / 1024 / 1024,  # MB
-                'cpu': cpu_percent,
-                'voiceConnections': sum(1 for guild in self.bot.guilds if guild.voice_client),
+                'memory': self._sys_stats['memory'],  # MB
+                'cpu': self._sys_stats['cpu'],
+                'voiceConnections': self.bot._voice_connection_count,
                 'currentSong': None,
-                'queue': [],
                 'volume': 80,
                 'isPlaying': False,
                 'isPaused': False,
@@ -234,28 +423,32 @@ class WebIntegration:
                     current_time = music_cog.get_current_time_seconds()
                     
                     state['currentSong'] = {
-                        'title': song.title,
-                        'artist': getattr(song, 'uploader', ''),
-                        'duration': song.duration,
-                        'currentTime': current_time,
-                        'thumbnail': getattr(song, 'thumbnail', ''),
-                        'url': song.url
+                        **song.to_player_dict(),
+                        'currentTime': current_time
                     }
                 
-                # Queue info
-                if hasattr(music_cog, 'queue_manager') and music_cog.queue_manager.queue:
-                    state['queue'] = []
-                    for song in music_cog.queue_manager.queue[:50]:  # Limit to 50 songs
-                        state['queue'].append({
-                            'title': song.title,
-                            'artist': getattr(song, 'uploader', ''),
-                            'duration': song.duration,
-                            'thumbnail': getattr(song, 'thumbnail', ''),
-                            'url': song.url,
-                            'requester': song.requester.display_name
-                        })
-            
-            await self.sio.emit('bot-state', state)
+            # Queue info: nur serialisieren, wenn sie sich geändert hat
+            queue_songs = []
+            if music_cog and hasattr(music_cog, 'queue_manager'):
+                queue_songs = list(islice(music_cog.queue_manager.queue, 50))  # Limit to 50 songs
+            queue_hash = hash(tuple(song.url for song in queue_songs))
+
+            if full or queue_hash != self._last_queue_hash:
+                state['queue'] = [song.to_queue_dict() for song in queue_songs]
+
+            if full:
+                await self._emit('bot-state', state)
+            else:
+                delta = {
+                    k: v for k, v in state.items()
+                    if k not in self._last_state or self._last_state[k] != v
+                }
+                if not delta:
+                    return
+                await self._emit('bot-state-delta', delta)
+
+            self._last_state.update(state)
+            self._last_queue_hash = queue_hash
             
         except Exception as e:
             logger.error("Error sending bot state", error=str(e))
@@ -267,13 +460,13 @@ class WebIntegration:
             # For now, send a placeholder
             logs = [
                 {
-                    'timestamp': time.time() * 1000,
+                    'timestamp': time.time_ns() // 1_000_000,
                     'level': 'INFO',
                     'message': 'Web interface connected'
                 }
             ]
             
-            await self.sio.emit('logs', logs)
+            await self._emit('logs', logs)
             
         except Exception as e:
             logger.error("Error sending logs", error=str(e))
@@ -285,66 +478,72 @@ class WebIntegration:
         
         try:
             log_entry = {
-                'timestamp': time.time() * 1000,
+                'timestamp': time.time_ns() // 1_000_000,
                 'level': level.upper(),
                 'message': message
             }
             
-            await self.sio.emit('new-log', log_entry)
+            await self._emit('new-log', log_entry)
             
         except Exception as e:
             logger.error("Error sending log entry", error=str(e))
     
     async def notify_song_change(self, song=None):
-        """Notify web interface of song change."""
+        """Notify web interface of song change (debounced)."""
         if not self.connected:
             return
         
-        try:
-            song_data = None
-            if song:
-                music_cog = self.bot.get_cog('Music')
-                current_time = music_cog.get_current_time_seconds() if music_cog else 0
-                
-                song_data = {
-                    'title': song.title,
-                    'artist': getattr(song, 'uploader', ''),
-                    'duration': song.duration,
-                    'currentTime': current_time,
-                    'thumbnail': getattr(song, 'thumbnail', ''),
-                    'url': song.url
-                }
-            
-            await self.sio.emit('song-update', song_data)
-            
-        except Exception as e:
-            logger.error("Error notifying song change", error=str(e))
+        self._song_dirty = True
+        self._pending_song = song
+        self._schedule_flush()
     
     async def notify_queue_change(self):
-        """Notify web interface of queue change."""
+        """Notify web interface of queue change (debounced)."""
         if not self.connected:
             return
         
+        self._queue_dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Arm the coalescing flush unless one is already pending."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_notifications())
+
+    async def _flush_notifications(self):
+        """Emit at most one song-update and one queue-update per window."""
+        await asyncio.sleep(0.05)
         try:
-            music_cog = self.bot.get_cog('Music')
-            if not music_cog or not hasattr(music_cog, 'queue_manager'):
-                return
+            if self._song_dirty:
+                self._song_dirty = False
+                song = self._pending_song
+                song_data = None
+                if song:
+                    music_cog = self._get_music_cog()
+                    current_time = music_cog.get_current_time_seconds() if music_cog else 0
+                    
+                    song_data = {
+                        **song.to_player_dict(),
+                        'currentTime': current_time
+                    }
+                
+                await self._emit('song-update', song_data)
             
-            queue_data = []
-            for song in music_cog.queue_manager.queue[:50]:  # Limit to 50 songs
-                queue_data.append({
-                    'title': song.title,
-                    'artist': getattr(song, 'uploader', ''),
-                    'duration': song.duration,
-                    'thumbnail': getattr(song, 'thumbnail', ''),
-                    'url': song.url,
-                    'requester': song.requester.display_name
-                })
+            if self._queue_dirty:
+                self._queue_dirty = False
+                music_cog = self._get_music_cog()
+                if music_cog and hasattr(music_cog, 'queue_manager'):
+                    queue_data = [
+                        song.to_queue_dict()
+                        for song in islice(music_cog.queue_manager.queue, 50)  # Limit to 50 songs
+                    ]
+                    
+                    await self._emit('queue-update', queue_data)
             
-            await self.sio.emit('queue-update', queue_data)
+            self._dirty.set()
             
         except Exception as e:
-            logger.error("Error notifying queue change", error=str(e))
+            logger.error("Error flushing web notifications", error=str(e))
 
 # Global web integration instance
 web_integration: Optional[WebIntegration] = None